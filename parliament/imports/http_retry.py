@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import random
+import threading
 import time
+from http.cookiejar import DefaultCookiePolicy
 from typing import Iterable, Mapping, Sequence
 
 import requests
 
 
-DEFAULT_RETRY_STATUS = {408, 425, 429, 500, 502, 503, 504}
+DEFAULT_RETRY_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+_NO_STATUS: frozenset[int] = frozenset()
+
+_local = threading.local()
 
 
 class HttpRequestError(RuntimeError):
@@ -20,6 +25,22 @@ class HttpRequestError(RuntimeError):
         self.status = status
 
 
+def _shared_session() -> requests.Session:
+    """Return this thread's keep-alive session, creating it on first use.
+
+    Sessions are per thread because requests.Session is not thread-safe;
+    reusing one per thread keeps TCP/TLS connections alive between imports.
+    Cookies are never stored, so one import cannot leak server state into
+    the next through the shared session.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _local.session = session
+    return session
+
+
 def fetch_with_backoff(
     url: str,
     *,
@@ -37,16 +58,19 @@ def fetch_with_backoff(
 ) -> requests.Response:
     """Perform an HTTP request with exponential backoff and jitter."""
 
-    request_fn = getattr(session or requests, method.lower(), None)
+    request_fn = getattr(session or _shared_session(), method.lower(), None)
     if request_fn is None:
         raise ValueError(f"Unsupported HTTP method: {method}")
 
-    attempt = 0
     last_error: Exception | None = None
-    retry_status_set = set(retry_status or DEFAULT_RETRY_STATUS)
-    allowed_status = tuple(allowed_status or ())
+    # Membership sets are built once per call, and only when the caller
+    # overrides a default.
+    retry_status_set = (
+        DEFAULT_RETRY_STATUS if retry_status is None else frozenset(retry_status))
+    allowed_status_set = (
+        frozenset(allowed_status) if allowed_status else _NO_STATUS)
 
-    while attempt <= retries:
+    for attempt in range(1, retries + 2):
         try:
             response = request_fn(
                 url,
@@ -55,22 +79,22 @@ def fetch_with_backoff(
                 data=data,
                 timeout=timeout,
             )
-            if allowed_status:
-                if response.status_code in allowed_status:
+            status = response.status_code
+            if allowed_status_set:
+                if status in allowed_status_set:
                     return response
-                raise HttpRequestError(url, response.status_code)
-            if response.status_code in retry_status_set:
-                raise HttpRequestError(url, response.status_code)
+                raise HttpRequestError(url, status)
+            if status in retry_status_set:
+                raise HttpRequestError(url, status)
             response.raise_for_status()
             return response
         except Exception as exc:  # pragma: no cover - network failure path varies
             last_error = exc
-            attempt += 1
             if attempt > retries:
                 break
-            delay = (backoff_factor ** attempt)
+            delay = backoff_factor ** attempt
             if jitter:
-                delay += random.uniform(0, jitter)
+                delay += jitter * random.random()
             time.sleep(delay)
 
     if isinstance(last_error, HttpRequestError):
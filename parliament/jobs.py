@@ -14,7 +14,7 @@ from parliament.activity.models import Activity
 from parliament.text_analysis import corpora
 from parliament.summaries.generation import update_hansard_summaries, update_reading_summaries
 from parliament.orchestration.watermarks import get_watermark, update_watermark
-from parliament.rag.ingest import RagIngestor
+from parliament.rag.ingest import IngestOptions, RagIngestor
 from src.services.ai.embedding_service import EmbeddingConfig, EmbeddingService
 
 import logging
@@ -158,8 +158,9 @@ def rag_ingest():
             "Skipping rag_ingest; embedding configuration missing: %s", exc)
         return
 
+    options = IngestOptions.from_env()
     try:
-        ingestor = RagIngestor(embedding_service)
+        ingestor = RagIngestor(embedding_service, options)
     except RuntimeError as exc:
         logger.warning(
             "Skipping rag_ingest; vector store configuration missing: %s", exc
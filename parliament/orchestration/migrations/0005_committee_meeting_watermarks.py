@@ -1,4 +1,5 @@
 import datetime
+import json
 
 from django.db import migrations
 from django.utils import timezone
@@ -14,6 +15,32 @@ def _as_aware(date_value, time_value):
     return dt
 
 
+UPSERT_PAGE_SIZE = 1000
+
+SQL_UPSERT_TEMPLATE = """
+INSERT INTO {table} (job_name, last_token, last_timestamp, metadata, created_at, updated_at)
+VALUES {values}
+ON CONFLICT (job_name) DO UPDATE SET
+    last_token = EXCLUDED.last_token,
+    last_timestamp = COALESCE(EXCLUDED.last_timestamp, {table}.last_timestamp),
+    metadata = EXCLUDED.metadata,
+    updated_at = NOW()
+"""
+ROW_TEMPLATE = "(%s, %s, %s, %s::jsonb, NOW(), NOW())"
+
+
+def _upsert_rows(connection, table, rows):
+    for start in range(0, len(rows), UPSERT_PAGE_SIZE):
+        page = rows[start: start + UPSERT_PAGE_SIZE]
+        sql = SQL_UPSERT_TEMPLATE.format(
+            table=connection.ops.quote_name(table),
+            values=", ".join([ROW_TEMPLATE] * len(page)),
+        )
+        params = [value for row in page for value in row]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+
 def seed_committee_watermarks(apps, schema_editor):
     Watermark = apps.get_model("orchestration", "EtlJobWatermark")
     CommitteeMeeting = apps.get_model("committees", "CommitteeMeeting")
@@ -23,6 +50,7 @@ def seed_committee_watermarks(apps, schema_editor):
         .order_by("session_id", "committee_id", "-date", "-start_time")
     )
     seen_keys = set()
+    rows = []
     for meeting in meetings:
         key = (meeting.session_id, meeting.committee_id)
         if key in seen_keys:
@@ -42,10 +70,10 @@ def seed_committee_watermarks(apps, schema_editor):
             "source_id": meeting.source_id,
             "date": meeting.date.isoformat() if meeting.date else None,
         }
-        defaults = {"last_token": token, "metadata": metadata}
-        if timestamp:
-            defaults["last_timestamp"] = timestamp
-        Watermark.objects.update_or_create(job_name=job_name, defaults=defaults)
+        rows.append((job_name, token, timestamp, json.dumps(metadata)))
+
+    if rows:
+        _upsert_rows(schema_editor.connection, Watermark._meta.db_table, rows)
 
 
 def remove_committee_watermarks(apps, schema_editor):
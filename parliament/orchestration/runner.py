@@ -4,7 +4,7 @@ import logging
 import time
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Sequence
+from typing import Callable, Dict, Iterable, Mapping, Sequence
 
 from django.db import close_old_connections, transaction
 from django.utils import timezone
@@ -45,6 +45,9 @@ class HourlyRunCoordinator:
         if len(names) != len(jobs):
             raise ValueError("job names must be unique")
         self._jobs = jobs
+        self._dependencies: Dict[str, frozenset[str]] = {
+            job.name: frozenset(job.dependencies) for job in jobs
+        }
         self._checkpoint_model = checkpoint_model or EtlJobCheckpoint
         self._sleep = sleep or time.sleep
         self._max_workers = max_workers or min(len(jobs), 4)
@@ -52,6 +55,7 @@ class HourlyRunCoordinator:
     def run(self, window_start) -> Dict[str, JobExecutionResult]:
         """Run the configured jobs for the provided hourly window."""
         results: Dict[str, JobExecutionResult] = {}
+        succeeded: set[str] = set()
         pending: Dict[str, EtlJobDefinition] = {
             job.name: job for job in self._jobs}
         running: Dict[object, EtlJobDefinition] = {}
@@ -60,13 +64,8 @@ class HourlyRunCoordinator:
             while pending or running:
                 ready_to_remove: list[str] = []
                 for name, job in list(pending.items()):
-                    unmet = self._unmet_dependencies(job.dependencies, results)
-                    if unmet and any(
-                            results.get(
-                                dep) and results[dep].status != self._checkpoint_model.Status.SUCCESS
-                            for dep in job.dependencies
-                            if dep in results
-                    ):
+                    unmet = self._unmet_dependencies(name, succeeded)
+                    if unmet and not unmet.isdisjoint(results):
                         self._mark_skipped(job.name, window_start, unmet)
                         results[job.name] = JobExecutionResult(
                             status=self._checkpoint_model.Status.SKIPPED,
@@ -91,6 +90,7 @@ class HourlyRunCoordinator:
                             attempt=prepared.attempt,
                             duration_seconds=0.0,
                         )
+                        succeeded.add(job.name)
                         ready_to_remove.append(name)
                         continue
 
@@ -110,10 +110,13 @@ class HourlyRunCoordinator:
                                return_when=FIRST_COMPLETED)
                 for future in done:
                     job = running.pop(future)
-                    results[job.name] = future.result()
+                    result = future.result()
+                    results[job.name] = result
+                    if result.status == self._checkpoint_model.Status.SUCCESS:
+                        succeeded.add(job.name)
 
         for job in pending.values():
-            unmet = self._unmet_dependencies(job.dependencies, results)
+            unmet = self._unmet_dependencies(job.name, succeeded)
             self._mark_skipped(job.name, window_start, unmet)
             results[job.name] = JobExecutionResult(
                 status=self._checkpoint_model.Status.SKIPPED,
@@ -207,22 +210,14 @@ class HourlyRunCoordinator:
                 if checkpoint.last_window_start == window_start
                 else 1
             )
-            checkpoint.last_window_start = window_start
-            checkpoint.last_started_at = timezone.now()
-            checkpoint.last_attempt = attempt
-            checkpoint.status = self._checkpoint_model.Status.RUNNING
-            checkpoint.last_error = ""
-            checkpoint.last_duration_seconds = None
-            checkpoint.save(
-                update_fields=[
-                    "last_window_start",
-                    "last_started_at",
-                    "last_attempt",
-                    "status",
-                    "last_error",
-                    "last_duration_seconds",
-                    "updated_at",
-                ]
+            self._save_changes(
+                checkpoint,
+                {"last_started_at": timezone.now()},
+                last_window_start=window_start,
+                last_attempt=attempt,
+                status=self._checkpoint_model.Status.RUNNING,
+                last_error="",
+                last_duration_seconds=None,
             )
         return PreparedRun(True, attempt)
 
@@ -231,20 +226,13 @@ class HourlyRunCoordinator:
             checkpoint, _ = self._checkpoint_model.objects.select_for_update().get_or_create(
                 job_name=job_name
             )
-            checkpoint.last_window_start = window_start
-            checkpoint.last_started_at = timezone.now()
-            checkpoint.last_attempt = attempt
-            checkpoint.status = self._checkpoint_model.Status.RUNNING
-            checkpoint.last_error = ""
-            checkpoint.save(
-                update_fields=[
-                    "last_window_start",
-                    "last_started_at",
-                    "last_attempt",
-                    "status",
-                    "last_error",
-                    "updated_at",
-                ]
+            self._save_changes(
+                checkpoint,
+                {"last_started_at": timezone.now()},
+                last_window_start=window_start,
+                last_attempt=attempt,
+                status=self._checkpoint_model.Status.RUNNING,
+                last_error="",
             )
 
     def _mark_success(
@@ -257,20 +245,13 @@ class HourlyRunCoordinator:
             checkpoint, _ = self._checkpoint_model.objects.select_for_update().get_or_create(
                 job_name=job_name
             )
-            checkpoint.last_completed_at = timezone.now()
-            checkpoint.last_attempt = attempt
-            checkpoint.status = self._checkpoint_model.Status.SUCCESS
-            checkpoint.last_error = ""
-            checkpoint.last_duration_seconds = duration
-            checkpoint.save(
-                update_fields=[
-                    "last_completed_at",
-                    "last_attempt",
-                    "status",
-                    "last_error",
-                    "last_duration_seconds",
-                    "updated_at",
-                ]
+            self._save_changes(
+                checkpoint,
+                {"last_completed_at": timezone.now()},
+                last_attempt=attempt,
+                status=self._checkpoint_model.Status.SUCCESS,
+                last_error="",
+                last_duration_seconds=duration,
             )
         logger.info(
             "Job %s succeeded on attempt %s in %.2fs",
@@ -321,41 +302,54 @@ class HourlyRunCoordinator:
                     job_name=job_name
                 )
             )
-            checkpoint.last_window_start = window_start
             now = timezone.now()
-            checkpoint.last_started_at = now
-            checkpoint.last_completed_at = now
-            checkpoint.last_attempt = 0
-            checkpoint.status = self._checkpoint_model.Status.SKIPPED
-            checkpoint.last_error = f"Skipped due to unmet dependencies: {reason}"
-            checkpoint.last_duration_seconds = 0.0
-            checkpoint.save(
-                update_fields=[
-                    "last_window_start",
-                    "last_started_at",
-                    "last_completed_at",
-                    "last_attempt",
-                    "status",
-                    "last_error",
-                    "last_duration_seconds",
-                    "updated_at",
-                ]
+            self._save_changes(
+                checkpoint,
+                {"last_started_at": now, "last_completed_at": now},
+                last_window_start=window_start,
+                last_attempt=0,
+                status=self._checkpoint_model.Status.SKIPPED,
+                last_error=f"Skipped due to unmet dependencies: {reason}",
+                last_duration_seconds=0.0,
             )
         logger.warning("Job %s skipped; unmet dependencies: %s",
                        job_name, reason)
 
+    @staticmethod
+    def _save_changes(
+            checkpoint: EtlJobCheckpoint,
+            timestamps: Mapping[str, object] | None = None,
+            **values,
+    ) -> bool:
+        """Assign ``values`` and save only the fields that actually changed.
+
+        ``timestamps`` (e.g. ``last_started_at``) are always fresh, so they
+        are not compared; they are written alongside the changed fields.
+        Returns ``False`` without touching the row (or ``updated_at``) when
+        every value already matches the loaded checkpoint.
+        """
+        update_fields = []
+        for field, value in values.items():
+            if getattr(checkpoint, field) != value:
+                setattr(checkpoint, field, value)
+                update_fields.append(field)
+        if not update_fields:
+            return False
+        for field, value in (timestamps or {}).items():
+            setattr(checkpoint, field, value)
+            update_fields.append(field)
+        update_fields.append("updated_at")
+        checkpoint.save(update_fields=update_fields)
+        return True
+
     def _truncate_error(self, error: str, limit: int = 2000) -> str:
         if len(error) <= limit:
             return error
         return f"{error[: limit - 3]}..."
 
-    @staticmethod
     def _unmet_dependencies(
-            dependencies: Iterable[str],
-            results: Dict[str, JobExecutionResult],
-    ) -> Iterable[str]:
-        unmet: list[str] = []
-        for dep in dependencies:
-            if dep not in results or results[dep].status != EtlJobCheckpoint.Status.SUCCESS:
-                unmet.append(dep)
-        return unmet
+            self,
+            job_name: str,
+            succeeded: set[str],
+    ) -> frozenset[str]:
+        return self._dependencies[job_name] - succeeded
@@ -0,0 +1,272 @@
+"""Pure corpus builders for member, committee and debate knowledge chunks.
+
+The ingestor snapshots prefetched ORM rows into the frozen records below so
+corpus assembly never touches the database and can run in worker processes.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping
+
+__all__ = [
+    "ActivitySnapshot",
+    "CandidacySnapshot",
+    "CommitteeProfile",
+    "MeetingSnapshot",
+    "MemberProfile",
+    "ServiceSnapshot",
+    "SessionSnapshot",
+    "build_committee_corpus",
+    "build_member_corpus",
+    "html_to_text",
+    "join_sections",
+    "strip_tags",
+]
+
+_TAG_RE = re.compile(r"<[A-Za-z/!?][^>]*>")
+
+
+# MARK: Snapshots
+
+@dataclass(frozen=True)
+class ServiceSnapshot:
+    """One elected-member term."""
+
+    start_date: datetime.date
+    end_date: datetime.date | None
+    riding: str | None
+    party_short_name: str | None
+    party_name: str | None
+
+
+@dataclass(frozen=True)
+class CandidacySnapshot:
+    """One election candidacy."""
+
+    elected: bool
+    party: str | None
+    riding: str | None
+    election: str
+    votepercent: object | None
+
+
+@dataclass(frozen=True)
+class MemberProfile:
+    """Everything needed to render a politician corpus."""
+
+    name: str
+    services: tuple[ServiceSnapshot, ...]
+    candidacies: tuple[CandidacySnapshot, ...]
+    info: Mapping[str, tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class SessionSnapshot:
+    """A committee's participation in a parliamentary session."""
+
+    name: str
+    acronym: str
+    source_url: str
+
+
+@dataclass(frozen=True)
+class ActivitySnapshot:
+    """A committee activity or study."""
+
+    label: str
+    study: bool
+    sessions: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class MeetingSnapshot:
+    """A recent committee meeting."""
+
+    number: int
+    date: datetime.date
+    in_camera: bool
+    activities: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CommitteeProfile:
+    """Everything needed to render a committee corpus."""
+
+    title: str
+    short_name: str
+    parent: str | None
+    joint: bool
+    sessions: tuple[SessionSnapshot, ...]
+    activities: tuple[ActivitySnapshot, ...]
+    meetings: tuple[MeetingSnapshot, ...]
+    subcommittees: tuple[str, ...]
+
+
+# MARK: Assembly
+
+def join_sections(sections: Iterable[Iterable[str]]) -> str:
+    """Join section lines with one ``str.join``; empty sections leave no gap."""
+    parts: list[str] = []
+    for lines in sections:
+        separator = "\n\n" if parts else ""
+        for line in lines:
+            parts.append(separator)
+            parts.append(line)
+            separator = "\n"
+    return "".join(parts)
+
+
+def strip_tags(value: str) -> str:
+    """Remove markup from server-rendered HTML; entities are left untouched."""
+    return _TAG_RE.sub("", value)
+
+
+def html_to_text(html: str) -> str:
+    return strip_tags(html).strip()
+
+
+# MARK: Member corpus
+
+def build_member_corpus(profile: MemberProfile) -> str:
+    sections = [_member_summary_section(profile)]
+    if profile.services:
+        sections.append(_member_service_section(profile.services))
+    if profile.candidacies:
+        sections.append(_member_candidacy_section(profile.candidacies))
+    if profile.info:
+        sections.append(_member_info_section(profile.info))
+    return join_sections(sections)
+
+
+def _member_summary_section(profile: MemberProfile) -> Iterator[str]:
+    if profile.services:
+        latest = profile.services[0]
+        tenure = (
+            f"since {latest.start_date:%Y-%m-%d}"
+            if latest.end_date is None
+            else f"from {latest.start_date:%Y-%m-%d} to {latest.end_date:%Y-%m-%d}"
+        )
+        riding = latest.riding or "an unknown riding"
+        party = latest.party_short_name or "an unknown party"
+        status = "currently" if latest.end_date is None else "previously"
+        intro = (
+            f"{profile.name} {status} serves as Member of Parliament for {riding} "
+            f"with the {party} party, {tenure}."
+        )
+    else:
+        # fallback
+        intro = f"{profile.name} is a Canadian political figure."
+    aliases = profile.info.get("alternate_name", ())
+    alias_text = (
+        " Alternate names include: " + ", ".join(aliases)
+        if aliases
+        else ""
+    )
+    yield (intro + alias_text).strip()
+
+
+def _member_service_section(
+    services: tuple[ServiceSnapshot, ...],
+) -> Iterator[str]:
+    yield "Parliamentary service history:"
+    for record in services:
+        party = record.party_name or "Unknown party"
+        riding = record.riding or "Unknown riding"
+        end_text = "present" if record.end_date is None else f"{record.end_date:%Y-%m-%d}"
+        yield f"- Served as MP for {riding} with the {party} from {record.start_date:%Y-%m-%d} to {end_text}."
+
+
+def _member_candidacy_section(
+    candidacies: tuple[CandidacySnapshot, ...],
+) -> Iterator[str]:
+    yield "Election history:"
+    for candidacy in candidacies:
+        elected = "won" if candidacy.elected else "ran"
+        party = candidacy.party or "Unknown party"
+        riding = candidacy.riding or "Unknown riding"
+        vote_fragment = (
+            f" receiving {candidacy.votepercent}% of the vote"
+            if candidacy.votepercent is not None
+            else ""
+        )
+        yield f"- {elected.capitalize()} in {riding} for the {party} during the {candidacy.election}{vote_fragment}."
+
+
+def _member_info_section(info: Mapping[str, tuple[str, ...]]) -> Iterator[str]:
+    """Render info values; ``info`` is pre-sorted and deduplicated.
+
+    Yields nothing when every entry is an alias; join_sections drops the gap.
+    """
+    header = "Additional details:"
+    for key, values in info.items():
+        if key == "alternate_name" or not values:
+            continue  # aliases are already represented in summary
+        if header:
+            yield header
+            header = ""
+        label = key.replace("_", " ")
+        yield f"- {label}: {', '.join(values)}"
+
+
+# MARK: Committee corpus
+
+def build_committee_corpus(profile: CommitteeProfile) -> str:
+    sections = [_committee_summary_section(profile)]
+    if profile.sessions:
+        sections.append(_committee_sessions_section(profile.sessions))
+    if profile.activities:
+        sections.append(_committee_activities_section(profile.activities))
+    if profile.meetings:
+        sections.append(_committee_meetings_section(profile.meetings))
+    if profile.subcommittees:
+        sections.append(_committee_subcommittees_section(profile.subcommittees))
+    return join_sections(sections)
+
+
+def _committee_summary_section(profile: CommitteeProfile) -> Iterator[str]:
+    summary = [
+        f"{profile.title} ({profile.short_name}) is a parliamentary committee." if profile.short_name else f"{profile.title} is a parliamentary committee.",
+        "It is a joint committee." if profile.joint else "It is a House of Commons committee.",
+    ]
+    if profile.parent:
+        summary.append(f"It reports to the {profile.parent} committee.")
+    yield " ".join(summary)
+
+
+def _committee_sessions_section(
+    sessions: tuple[SessionSnapshot, ...],
+) -> Iterator[str]:
+    yield "Parliamentary sessions:"
+    for session in sessions:
+        yield f"- {session.name} ({session.acronym}) – source: {session.source_url}"
+
+
+def _committee_activities_section(
+    activities: tuple[ActivitySnapshot, ...],
+) -> Iterator[str]:
+    yield "Activities and studies:"
+    for activity in activities:
+        activity_type = "study" if activity.study else "activity"
+        sessions = ", ".join(activity.sessions)
+        session_text = f" (sessions: {sessions})" if sessions else ""
+        yield f"- {activity.label} – {activity_type}{session_text}."
+
+
+def _committee_meetings_section(
+    meetings: tuple[MeetingSnapshot, ...],
+) -> Iterator[str]:
+    yield "Recent meetings:"
+    for meeting in meetings:
+        activities = ", ".join(meeting.activities)
+        activity_text = f" covering {activities}" if activities else ""
+        camera_text = " in camera" if meeting.in_camera else ""
+        yield f"- Meeting {meeting.number} on {meeting.date:%Y-%m-%d}{camera_text}{activity_text}."
+
+
+def _committee_subcommittees_section(
+    subcommittees: tuple[str, ...],
+) -> Iterator[str]:
+    yield f"Subcommittees: {', '.join(subcommittees)}."
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import multiprocessing
+import os
 from dataclasses import dataclass
-from typing import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
 
-from django.contrib.postgres.search import SearchVector
-from django.db import transaction
+from django.db import connection, transaction
 from django.db.models import Prefetch
-from django.utils.html import strip_tags
-from django.utils.text import Truncator
 
 from parliament.bills.models import Bill
 from parliament.committees.models import (
@@ -22,21 +24,84 @@ from parliament.committees.models import (
 )
 from parliament.core.models import ElectedMember, Politician
 from parliament.elections.models import Candidacy
-from parliament.hansards.models import Document
-from parliament.rag.models import KnowledgeChunk, KnowledgeSource
+from parliament.hansards.models import Document, Statement
+from parliament.rag.corpus import (
+    ActivitySnapshot,
+    CandidacySnapshot,
+    CommitteeProfile,
+    MeetingSnapshot,
+    MemberProfile,
+    ServiceSnapshot,
+    SessionSnapshot,
+    build_committee_corpus,
+    build_member_corpus,
+    html_to_text,
+    strip_tags,
+)
+from parliament.rag.models import (
+    EmbeddingCache,
+    KnowledgeChunk,
+    KnowledgeSource,
+    pack_vector,
+)
+from parliament.rag.pipeline import (
+    MAX_INFLIGHT_BATCHES,
+    ChunkRecord,
+    EmbeddingPipeline,
+    PendingChunk,
+    VectorCache,
+)
 from src.services.ai.embedding_service import EmbeddingService
 from src.services.rag.jurisdiction import normalize_jurisdiction
 from src.services.rag.language import normalize_language
-from src.services.rag.chunker import chunk_text
+from src.services.rag.chunker import (
+    chunk_text,
+    token_safe_length,
+    truncate_tokens,
+)
 from src.services.rag.vector_store import QdrantConfig, QdrantVectorStore
 
 
 logger = logging.getLogger(__name__)
 
 MAX_EMBEDDING_TOKENS = 8000
-TOKEN_TO_CHAR_RATIO = 4
+# Chunks up to this many characters fit the token ceiling without tokenizing.
+MAX_CHUNK_CHARS = token_safe_length(MAX_EMBEDDING_TOKENS)
+UPSERT_PAGE_SIZE = 500
+TITLE_MAX_LENGTH = 240
+# Room reserved for the " [idx]" chunk suffix (up to 9999 chunks per source).
+CHUNK_SUFFIX_BUDGET = len(" [9999]")
+STREAM_CHUNK_SIZE = 10
+RECENT_MEETING_LIMIT = 5
+CORPUS_MAP_CHUNKSIZE = 8
+
+ProfileT = TypeVar("ProfileT")
+
+# search_document is maintained by the rag_knowledgechunk_search_document
+# trigger (migration 0004), which picks the text search config per row.
+SQL_UPSERT_CHUNKS = """
+INSERT INTO {table} (
+    source_type, source_identifier, language, jurisdiction, title,
+    content, content_hash, embedding, created_at, updated_at
+)
+SELECT
+    v.source_type, v.source_identifier, v.language, v.jurisdiction, v.title,
+    v.content, v.content_hash, v.embedding, NOW(), NOW()
+FROM (VALUES {values}) AS v (
+    source_type, source_identifier, language, jurisdiction, title,
+    content, content_hash, embedding
+)
+ON CONFLICT (source_type, source_identifier, language, jurisdiction, title)
+DO UPDATE SET
+    content = EXCLUDED.content,
+    content_hash = EXCLUDED.content_hash,
+    embedding = EXCLUDED.embedding,
+    updated_at = NOW()
+RETURNING id, source_type, source_identifier, title
+"""
+ROW_TEMPLATE = "(%s, %s, %s, %s, %s, %s, %s, %s::bytea)"
 
-__all__ = ["RagIngestor", "IngestOptions"]
+__all__ = ["RagIngestor", "IngestOptions", "ChunkRecord"]
 
 
 # MARK: Configuration
@@ -52,19 +117,31 @@ class IngestOptions:
     member_limit: int | None = 50
     committee_limit: int | None = 20
     chunk_size: int = 800
+    corpus_workers: int = 0
+
+    @staticmethod
+    def from_env() -> "IngestOptions":
+        # Opt-in: spawned workers only pay off for large member/committee
+        # syncs, so unset, 0 or 1 builds corpora inline.
+        workers_raw = os.getenv("RAG_CORPUS_WORKERS") or "0"
+        try:
+            corpus_workers = max(0, int(workers_raw))
+        except ValueError as exc:  # pragma: no cover - configuration guard
+            raise RuntimeError("RAG_CORPUS_WORKERS must be numeric") from exc
+        return IngestOptions(corpus_workers=corpus_workers)
 
 
 # MARK: Helpers
 
 
-def _search_config(language: str) -> str:
-    if language.lower().startswith("fr"):
-        return "french"
-    return "english"
+def _content_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
 
 
-def _truncate_title(title: str) -> str:
-    return Truncator(title).chars(240)
+def _truncate_title(title: str, max_length: int = TITLE_MAX_LENGTH) -> str:
+    if len(title) <= max_length:
+        return title
+    return title[: max_length - 1] + "…"
 
 
 # MARK: Ingestor
@@ -80,7 +157,17 @@ class RagIngestor:
         vector_store: QdrantVectorStore | None = None,
     ) -> None:
         self._embedding_service = embedding_service
+        # Services without a model name (e.g. test doubles) skip the cache.
+        self._embedding_model: str | None = getattr(
+            embedding_service, "model", None)
         self._options = self._normalize_options(options or IngestOptions())
+        # Reused across sync_* calls so boilerplate repeats between sources hit.
+        self._vector_cache = VectorCache()
+        # Scope fields are fixed per run; per-chunk payloads extend a copy.
+        self._payload_scope: dict[str, object] = {
+            "jurisdiction": self._options.jurisdiction,
+            "language": self._options.language,
+        }
         self._vector_store = vector_store or QdrantVectorStore(
             QdrantConfig.from_env())
 
@@ -88,61 +175,86 @@ class RagIngestor:
 
     def sync_recent_hansards(self) -> None:
         """Top-level wrapper for debate documents."""
-        documents = list(
-            Document.debates.order_by("-date")[: self._options.debate_limit]
+        documents = (
+            Document.debates.order_by("-date")
+            .only("id", "date", "number", "source_id")
+            .prefetch_related(
+                Prefetch(
+                    "statement_set",
+                    queryset=self._statement_queryset(),
+                    to_attr="rag_statements",
+                )
+            )[: self._options.debate_limit]
+            .iterator(chunk_size=STREAM_CHUNK_SIZE)
         )
         logger.info(
-            "Syncing %s recent hansards for %s/%s",
-            len(documents),
+            "Syncing recent hansards for %s/%s",
             self._options.jurisdiction,
             self._options.language,
         )
-        for document in documents:
-            body = self._document_body(document)
-            if not body:
-                logger.info(
-                    "Skipping Hansard %s due to empty body",
-                    document.id,
-                )
-                continue
-            title = f"Hansard {document.date:%Y-%m-%d} #{document.number}" if document.date else f"Hansard #{document.id}"
-            chunk_total = self._index_chunks(
-                source_type=KnowledgeSource.DEBATE,
-                source_identifier=str(document.source_id),
-                base_title=title,
-                raw_text=body,
+        # Markup is stripped by _map_corpora, in worker processes when
+        # corpus_workers is set; statements are read here in the main process.
+        sources = (
+            (
+                str(document.source_id),
+                f"Hansard {document.date:%Y-%m-%d} #{document.number}" if document.date else f"Hansard #{document.id}",
+                self._document_html(document),
             )
-            logger.info("Indexed %s chunks for %s", chunk_total, title)
+            for document in documents
+        )
+        with self._embedding_pipeline() as pipeline:
+            for identifier, title, body in self._map_corpora(html_to_text, sources):
+                if not body:
+                    logger.info("Skipping %s due to empty body", title)
+                    continue
+                chunk_total = self._index_chunks(
+                    pipeline,
+                    source_type=KnowledgeSource.DEBATE,
+                    source_identifier=identifier,
+                    base_title=title,
+                    raw_text=body,
+                )
+                logger.info("Queued %s chunks for %s", chunk_total, title)
+                self._flush_ready(pipeline)
+        self._flush_chunks(pipeline.take_records())
 
     def sync_recent_bills(self) -> None:
         """Sync notable bill texts."""
-        bills = list(
+        bills = (
             Bill.objects.filter(text_docid__isnull=False)
             .exclude(short_title_en="")
-            .order_by("-status_date", "-introduced")[: self._options.bill_limit]
+            .order_by("-status_date", "-introduced")
+            .only(
+                "id", "number", "short_title_en", "name_en", "name_fr",
+                "text_docid", "legisinfo_id",
+            )[: self._options.bill_limit]
+            .iterator(chunk_size=STREAM_CHUNK_SIZE)
         )
         logger.info(
-            "Syncing %s recent bills for %s/%s",
-            len(bills),
+            "Syncing recent bills for %s/%s",
             self._options.jurisdiction,
             self._options.language,
         )
-        for bill in bills:
-            text = bill.get_text(self._options.language)
-            if not text:
-                logger.info(
-                    "Skipping bill %s due to missing text", bill.number)
-                continue
-            title = f"Bill {bill.number} – {bill.short_title_en or bill.name_en or bill.name}".strip(
-            )
-            identifier = f"bill:{bill.legisinfo_id or bill.id}"
-            chunk_total = self._index_chunks(
-                source_type=KnowledgeSource.BILL,
-                source_identifier=identifier,
-                base_title=title,
-                raw_text=text,
-            )
-            logger.info("Indexed %s chunks for %s", chunk_total, title)
+        with self._embedding_pipeline() as pipeline:
+            for bill in bills:
+                text = bill.get_text(self._options.language)
+                if not text:
+                    logger.info(
+                        "Skipping bill %s due to missing text", bill.number)
+                    continue
+                title = f"Bill {bill.number} – {bill.short_title_en or bill.name_en or bill.name}".strip(
+                )
+                identifier = f"bill:{bill.legisinfo_id or bill.id}"
+                chunk_total = self._index_chunks(
+                    pipeline,
+                    source_type=KnowledgeSource.BILL,
+                    source_identifier=identifier,
+                    base_title=title,
+                    raw_text=text,
+                )
+                logger.info("Queued %s chunks for %s", chunk_total, title)
+                self._flush_ready(pipeline)
+        self._flush_chunks(pipeline.take_records())
 
     def sync_members(self) -> None:
         """Sync biographies and service records for elected politicians."""
@@ -167,41 +279,52 @@ class RagIngestor:
         )
         if self._options.member_limit and self._options.member_limit > 0:
             members_qs = members_qs[: self._options.member_limit]
-        politicians = list(members_qs)
-        if not politicians:
-            logger.info("No politicians matched ingestion criteria")
-            return
         logger.info(
-            "Syncing %s politician profile(s) for %s/%s",
-            len(politicians),
+            "Syncing politician profiles for %s/%s",
             self._options.jurisdiction,
             self._options.language,
         )
-        for politician in politicians:
-            corpus = self._build_member_corpus(politician)
-            if not corpus:
-                logger.info(
-                    "Skipping politician %s due to empty corpus", politician)
-                continue
-            identifier = f"member:{politician.slug or politician.id}"
-            title = f"{politician.name} profile"
-            chunk_total = self._index_chunks(
-                source_type=KnowledgeSource.MEMBER,
-                source_identifier=identifier,
-                base_title=title,
-                raw_text=corpus,
+        politician_total = 0
+        profiles = (
+            (
+                f"member:{politician.slug or politician.id}",
+                politician.name,
+                self._member_profile(politician),
             )
-            logger.info("Indexed %s chunks for %s",
-                        chunk_total, politician.name)
+            for politician in members_qs.iterator(chunk_size=STREAM_CHUNK_SIZE)
+        )
+        with self._embedding_pipeline() as pipeline:
+            for identifier, name, corpus in self._map_corpora(
+                build_member_corpus, profiles
+            ):
+                politician_total += 1
+                if not corpus:
+                    logger.info(
+                        "Skipping politician %s due to empty corpus", name)
+                    continue
+                title = f"{name} profile"
+                chunk_total = self._index_chunks(
+                    pipeline,
+                    source_type=KnowledgeSource.MEMBER,
+                    source_identifier=identifier,
+                    base_title=title,
+                    raw_text=corpus,
+                )
+                logger.info("Queued %s chunks for %s", chunk_total, name)
+                self._flush_ready(pipeline)
+        if not politician_total:
+            logger.info("No politicians matched ingestion criteria")
+            return
+        self._flush_chunks(pipeline.take_records())
 
     def sync_committees(self) -> None:
         """Sync descriptive content for parliamentary committees."""
         meetings_prefetch = Prefetch(
             "committeemeeting_set",
-            queryset=CommitteeMeeting.objects.select_related(
-                "session", "committee")
-            .prefetch_related("activities")
-            .order_by("-date"),
+            queryset=self._recent_meetings_queryset(
+                CommitteeMeeting.objects.all()
+            )[:RECENT_MEETING_LIMIT],
+            to_attr="rag_recent_meetings",
         )
         activities_prefetch = Prefetch(
             "committeeactivity_set",
@@ -237,50 +360,133 @@ class RagIngestor:
         )
         if self._options.committee_limit and self._options.committee_limit > 0:
             committees_qs = committees_qs[: self._options.committee_limit]
-        committees = list(committees_qs)
-        if not committees:
-            logger.info("No committees matched ingestion criteria")
-            return
         logger.info(
-            "Syncing %s committee profile(s) for %s/%s",
-            len(committees),
+            "Syncing committee profiles for %s/%s",
             self._options.jurisdiction,
             self._options.language,
         )
-        for committee in committees:
-            corpus = self._build_committee_corpus(committee)
-            if not corpus:
-                logger.info(
-                    "Skipping committee %s due to empty corpus", committee)
-                continue
-            identifier = f"committee:{committee.slug}"
-            title = f"{committee.name_en} overview"
-            chunk_total = self._index_chunks(
-                source_type=KnowledgeSource.COMMITTEE,
-                source_identifier=identifier,
-                base_title=title,
-                raw_text=corpus,
+        committee_total = 0
+        profiles = (
+            (
+                f"committee:{committee.slug}",
+                committee.name_en,
+                self._committee_profile(committee),
             )
-            logger.info("Indexed %s chunks for %s",
-                        chunk_total, committee.name_en)
+            for committee in committees_qs.iterator(chunk_size=STREAM_CHUNK_SIZE)
+        )
+        with self._embedding_pipeline() as pipeline:
+            for identifier, name, corpus in self._map_corpora(
+                build_committee_corpus, profiles
+            ):
+                committee_total += 1
+                if not corpus:
+                    logger.info(
+                        "Skipping committee %s due to empty corpus", name)
+                    continue
+                title = f"{name} overview"
+                chunk_total = self._index_chunks(
+                    pipeline,
+                    source_type=KnowledgeSource.COMMITTEE,
+                    source_identifier=identifier,
+                    base_title=title,
+                    raw_text=corpus,
+                )
+                logger.info("Queued %s chunks for %s", chunk_total, name)
+                self._flush_ready(pipeline)
+        if not committee_total:
+            logger.info("No committees matched ingestion criteria")
+            return
+        self._flush_chunks(pipeline.take_records())
 
     # MARK: Internal API
 
-    def _document_body(self, document: Document) -> str:
-        statements = document.statement_set.filter(procedural=False)
+    def _map_corpora(
+        self,
+        builder: Callable[[ProfileT], str],
+        profiles: Iterable[tuple[str, str, ProfileT]],
+    ) -> Iterator[tuple[str, str, str]]:
+        """Yield ``(identifier, name, corpus)``, optionally across processes.
+
+        Profiles (snapshots or raw document HTML) are loaded in this process,
+        so workers never touch the database; with ``corpus_workers`` unset
+        corpora are built inline.
+        """
+        workers = self._options.corpus_workers
+        if workers <= 1:
+            for identifier, name, profile in profiles:
+                yield identifier, name, builder(profile)
+            return
+        # Profiles are read in bounded windows, one window ahead of the one
+        # being yielded, so workers stay busy without loading every source.
+        window = workers * CORPUS_MAP_CHUNKSIZE
+        remaining = iter(profiles)
+        pending = None
+        # Spawned workers import only the DB-free builders, never Django, and
+        # are safe to start while the embedding pipeline threads are running.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            while True:
+                entries = list(islice(remaining, window))
+                submitted = (
+                    (
+                        entries,
+                        executor.map(
+                            builder,
+                            [profile for _, _, profile in entries],
+                            chunksize=CORPUS_MAP_CHUNKSIZE,
+                        ),
+                    )
+                    if entries
+                    else None
+                )
+                if pending is not None:
+                    batch, corpora = pending
+                    for (identifier, name, _), corpus in zip(batch, corpora):
+                        yield identifier, name, corpus
+                if submitted is None:
+                    return
+                pending = submitted
+
+    def _statement_queryset(self):
+        return Statement.objects.filter(procedural=False).only(
+            "document", f"content_{self._options.language}"
+        )
+
+    def _document_html(self, document: Document) -> str:
+        statements = getattr(document, "rag_statements", None)
+        if statements is None:
+            statements = self._statement_queryset().filter(document=document)
         field = f"content_{self._options.language}"
-        contents = [strip_tags(getattr(statement, field, ""))
-                    for statement in statements]
-        return "\n\n".join(s for s in contents if s)
+        # Joined so markup is stripped in a single regex pass; the chunker
+        # drops any blank paragraphs left by markup-only statements.
+        return "\n\n".join(
+            content for statement in statements
+            if (content := getattr(statement, field, ""))
+        )
+
+    def _embedding_pipeline(self) -> EmbeddingPipeline:
+        return EmbeddingPipeline(
+            self._embedding_service.embed,
+            max_inflight=getattr(
+                self._embedding_service,
+                "max_concurrent_requests",
+                MAX_INFLIGHT_BATCHES,
+            ),
+            cache=self._vector_cache,
+        )
 
     def _index_chunks(
         self,
+        pipeline: EmbeddingPipeline,
         *,
         source_type: str,
         source_identifier: str,
         base_title: str,
         raw_text: str,
     ) -> int:
+        """Queue changed chunks for embedding; returns the number queued."""
         chunks = list(
             chunk_text(
                 base_title,
@@ -291,110 +497,107 @@ class RagIngestor:
         if not chunks:
             logger.info("No chunks generated for %s", base_title)
             return 0
-        prepared_texts = [self._prepare_chunk_text(chunk.text, idx)
-                          for idx, chunk in enumerate(chunks, start=1)]
-        embeddings = self._embedding_service.embed(prepared_texts)
-        for idx, (chunk, embedding, text) in enumerate(
-            zip(chunks, embeddings, prepared_texts),
-            start=1,
-        ):
-            chunk_title = _truncate_title(f"{base_title} [{idx}]")
-            self._upsert_chunk(
+        texts = [chunk.text for chunk in chunks]
+        # One length scan covers the common case where nothing needs trimming.
+        if max(map(len, texts)) > MAX_CHUNK_CHARS:
+            texts = [self._prepare_chunk_text(text, idx)
+                     for idx, text in enumerate(texts, start=1)]
+        stored_hashes = dict(
+            KnowledgeChunk.objects.filter(
                 source_type=source_type,
                 source_identifier=source_identifier,
-                title=chunk_title,
-                content=text,
-                embedding=embedding,
+                language=self._options.language,
+                jurisdiction=self._options.jurisdiction,
+            ).values_list("title", "content_hash")
+        )
+        changed: list[tuple[str, str, str]] = []
+        # Truncate the base once so long titles keep distinct [idx] suffixes.
+        prefix = _truncate_title(
+            base_title, TITLE_MAX_LENGTH - CHUNK_SUFFIX_BUDGET)
+        for idx, text in enumerate(texts, start=1):
+            title = _truncate_title(f"{prefix} [{idx}]")
+            content_hash = _content_hash(text)
+            if stored_hashes.get(title) != content_hash:
+                changed.append((title, text, content_hash))
+        cached = self._cached_embeddings(
+            [content_hash for _, _, content_hash in changed])
+        for title, text, content_hash in changed:
+            pipeline.submit(
+                PendingChunk(
+                    source_type=source_type,
+                    source_identifier=source_identifier,
+                    title=title,
+                    content=text,
+                    content_hash=content_hash,
+                    embedding=cached.get(content_hash),
+                )
             )
-        return len(chunks)
-
-    # MARK: Member ingestion helpers
-
-    def _build_member_corpus(self, politician: Politician) -> str:
-        sections = [
-            self._member_summary_section(politician),
-            self._member_service_section(politician),
-            self._member_candidacy_section(politician),
-            self._member_info_section(politician),
-        ]
-        return "\n\n".join(
-            segment.strip() for segment in sections if segment and segment.strip()
+        queued = len(changed)
+        if queued < len(texts):
+            logger.info("Skipped %s unchanged chunk(s) for %s",
+                        len(texts) - queued, base_title)
+        return queued
+
+    def _cached_embeddings(
+        self, hashes: Sequence[str]
+    ) -> dict[str, Sequence[float]]:
+        """Return cached vectors for ``hashes`` under the current model."""
+        if not hashes or not self._embedding_model:
+            return {}
+        return dict(
+            EmbeddingCache.objects.filter(
+                model=self._embedding_model, content_hash__in=hashes
+            ).values_list("content_hash", "vector")
         )
 
-    def _member_summary_section(self, politician: Politician) -> str:
-        members = self._prefetched_members(politician)
-        if members:
-            latest = members[0]
-            tenure = (
-                f"since {latest.start_date:%Y-%m-%d}"
-                if latest.end_date is None
-                else f"from {latest.start_date:%Y-%m-%d} to {latest.end_date:%Y-%m-%d}"
-            )
-            riding = latest.riding.dashed_name if latest.riding else "an unknown riding"
-            party = latest.party.short_name_en if latest.party else "an unknown party"
-            status = "currently" if latest.end_date is None else "previously"
-            intro = (
-                f"{politician.name} {status} serves as Member of Parliament for {riding} "
-                f"with the {party} party, {tenure}."
-            )
-        else:
-            # fallback
-            intro = f"{politician.name} is a Canadian political figure."
-        aliases = self._info_lookup(politician).get("alternate_name", [])
-        alias_text = (
-            " Alternate names include: " + ", ".join(sorted(set(aliases)))
-            if aliases
-            else ""
+    def _cache_embeddings(self, records: Iterable[ChunkRecord]) -> None:
+        if not self._embedding_model:
+            return
+        entries = {
+            record.content_hash: record.embedding
+            for record in records
+            if record.content_hash and not record.cached
+        }
+        EmbeddingCache.objects.bulk_create(
+            [
+                EmbeddingCache(
+                    content_hash=content_hash,
+                    model=self._embedding_model,
+                    vector=vector,
+                )
+                for content_hash, vector in entries.items()
+            ],
+            batch_size=UPSERT_PAGE_SIZE,
+            ignore_conflicts=True,
         )
-        return (intro + alias_text).strip()
 
-    def _member_service_section(self, politician: Politician) -> str:
-        members = self._prefetched_members(politician)
-        if not members:
-            return ""
-        lines: list[str] = ["Parliamentary service history:"]
-        for record in members:
-            party = record.party.name_en if record.party else "Unknown party"
-            riding = record.riding.dashed_name if record.riding else "Unknown riding"
-            end_text = "present" if record.end_date is None else f"{record.end_date:%Y-%m-%d}"
-            lines.append(
-                f"- Served as MP for {riding} with the {party} from {record.start_date:%Y-%m-%d} to {end_text}."
-            )
-        return "\n".join(lines)
+    # MARK: Member ingestion helpers
 
-    def _member_candidacy_section(self, politician: Politician) -> str:
-        candidacies = self._prefetched_candidacies(politician)
-        if not candidacies:
-            return ""
-        lines = ["Election history:"]
-        for candidacy in candidacies:
-            elected = "won" if candidacy.elected else "ran"
-            party = candidacy.party.name_en if candidacy.party else "Unknown party"
-            riding = candidacy.riding.dashed_name if candidacy.riding else "Unknown riding"
-            vote_fragment = (
-                f" receiving {candidacy.votepercent}% of the vote"
-                if candidacy.votepercent is not None
-                else ""
-            )
-            lines.append(
-                f"- {elected.capitalize()} in {riding} for the {party} during the {candidacy.election}{vote_fragment}."
-            )
-        return "\n".join(lines)
-
-    def _member_info_section(self, politician: Politician) -> str:
-        info = self._info_lookup(politician)
-        if not info:
-            return ""
-        lines = ["Additional details:"]
-        for key in sorted(info):
-            if key == "alternate_name":
-                continue  # already represented in summary
-            values = sorted({value for value in info[key] if value})
-            if not values:
-                continue
-            label = key.replace("_", " ")
-            lines.append(f"- {label}: {', '.join(values)}")
-        return "\n".join(lines)
+    def _member_profile(self, politician: Politician) -> MemberProfile:
+        return MemberProfile(
+            name=politician.name,
+            services=tuple(
+                ServiceSnapshot(
+                    start_date=record.start_date,
+                    end_date=record.end_date,
+                    riding=record.riding.dashed_name if record.riding else None,
+                    party_short_name=record.party.short_name_en if record.party else None,
+                    party_name=record.party.name_en if record.party else None,
+                )
+                for record in self._prefetched_members(politician)
+            ),
+            candidacies=tuple(
+                CandidacySnapshot(
+                    elected=bool(candidacy.elected),
+                    party=candidacy.party.name_en if candidacy.party else None,
+                    riding=candidacy.riding.dashed_name if candidacy.riding else None,
+                    election=str(candidacy.election),
+                    votepercent=candidacy.votepercent,
+                )
+                for candidacy in self._prefetched_candidacies(politician)
+            ),
+            info=self._info_lookup(politician),
+        )
 
     def _prefetched_members(self, politician: Politician) -> list[ElectedMember]:
         manager = getattr(politician, "electedmember_set", None)
@@ -419,47 +622,72 @@ class RagIngestor:
             )
         return candidacies
 
-    def _info_lookup(self, politician: Politician) -> dict[str, list[str]]:
+    def _info_lookup(self, politician: Politician) -> dict[str, tuple[str, ...]]:
+        """Return cleaned info values per schema, deduplicated and sorted.
+
+        Keys are inserted in sorted order so consumers can iterate directly.
+        """
         manager = getattr(politician, "politicianinfo_set", None)
         info_entries = list(manager.all()) if manager is not None else [
         ]  # type: ignore[attr-defined]
         if not info_entries:
             info_entries = list(politician.politicianinfo_set.all())
-        lookup: dict[str, list[str]] = {}
+        lookup: dict[str, set[str]] = {}
         for entry in info_entries:
             cleaned = strip_tags(str(entry.value)).strip()
             if not cleaned:
                 continue
-            lookup.setdefault(entry.schema, []).append(cleaned)
-        return lookup
+            lookup.setdefault(entry.schema, set()).add(cleaned)
+        return {key: tuple(sorted(lookup[key])) for key in sorted(lookup)}
 
     # MARK: Committee ingestion helpers
 
-    def _build_committee_corpus(self, committee: Committee) -> str:
-        sections = [
-            self._committee_summary_section(committee),
-            self._committee_sessions_section(committee),
-            self._committee_activities_section(committee),
-            self._committee_meetings_section(committee),
-            self._committee_subcommittees_section(committee),
-        ]
-        return "\n\n".join(
-            segment.strip() for segment in sections if segment and segment.strip()
+    def _committee_profile(self, committee: Committee) -> CommitteeProfile:
+        return CommitteeProfile(
+            title=committee.name_en or committee.name,
+            short_name=committee.short_name_en or committee.short_name,
+            parent=committee.parent.name_en if committee.parent else None,
+            joint=committee.joint,
+            sessions=tuple(
+                SessionSnapshot(
+                    name=(
+                        link.session.name if link.session else str(link.session_id)
+                    ),
+                    acronym=link.acronym,
+                    source_url=link.get_source_url(),
+                )
+                for link in self._committee_sessions(committee)
+            ),
+            activities=tuple(
+                ActivitySnapshot(
+                    label=activity.name_en or activity.name,
+                    study=activity.study,
+                    sessions=tuple(
+                        link.session.name if link.session else str(
+                            link.session_id)
+                        for link in activity.committeeactivityinsession_set.all()
+                    ),
+                )
+                for activity in self._committee_activities(committee)[:15]
+            ),
+            meetings=tuple(
+                MeetingSnapshot(
+                    number=meeting.number,
+                    date=meeting.date,
+                    in_camera=meeting.in_camera,
+                    activities=tuple(
+                        activity.name_en for activity in meeting.activities.all()
+                    ),
+                )
+                for meeting in self._committee_meetings(committee)
+            ),
+            subcommittees=tuple(
+                sub.short_name_en or sub.name_en
+                for sub in self._committee_subcommittees(committee)
+            ),
         )
 
-    def _committee_summary_section(self, committee: Committee) -> str:
-        title = committee.name_en or committee.name
-        short_name = committee.short_name_en or committee.short_name
-        parent = committee.parent.name_en if committee.parent else None
-        summary = [
-            f"{title} ({short_name}) is a parliamentary committee." if short_name else f"{title} is a parliamentary committee.",
-            "It is a joint committee." if committee.joint else "It is a House of Commons committee.",
-        ]
-        if parent:
-            summary.append(f"It reports to the {parent} committee.")
-        return " ".join(summary)
-
-    def _committee_sessions_section(self, committee: Committee) -> str:
+    def _committee_sessions(self, committee: Committee) -> list[CommitteeInSession]:
         manager = getattr(committee, "committeeinsession_set", None)
         # type: ignore[attr-defined]
         sessions = list(manager.all()) if manager is not None else []
@@ -468,19 +696,9 @@ class RagIngestor:
                 committee.committeeinsession_set.select_related("session")
                 .order_by("-session__start")
             )
-        if not sessions:
-            return ""
-        lines = ["Parliamentary sessions:"]
-        for session_link in sessions:
-            session = session_link.session
-            session_name = session.name if session else str(
-                session_link.session_id)
-            lines.append(
-                f"- {session_name} ({session_link.acronym}) – source: {session_link.get_source_url()}"
-            )
-        return "\n".join(lines)
+        return sessions
 
-    def _committee_activities_section(self, committee: Committee) -> str:
+    def _committee_activities(self, committee: Committee) -> list[CommitteeActivity]:
         manager = getattr(committee, "committeeactivity_set", None)
         activities = list(manager.all()) if manager is not None else [
         ]  # type: ignore[attr-defined]
@@ -495,63 +713,47 @@ class RagIngestor:
                     )
                 ).order_by("name_en")
             )
-        if not activities:
-            return ""
-        lines = ["Activities and studies:"]
-        for activity in activities[:15]:
-            label = activity.name_en or activity.name
-            activity_type = "study" if activity.study else "activity"
-            sessions = ", ".join(
-                (
-                    link.session.name if link.session else str(link.session_id)
-                )
-                for link in activity.committeeactivityinsession_set.all()
-            )
-            session_text = f" (sessions: {sessions})" if sessions else ""
-            lines.append(f"- {label} – {activity_type}{session_text}.")
-        return "\n".join(lines)
+        return activities
 
-    def _committee_meetings_section(self, committee: Committee) -> str:
-        manager = getattr(committee, "committeemeeting_set", None)
-        # type: ignore[attr-defined]
-        meetings = list(manager.all()) if manager is not None else []
-        if not meetings:
+    def _committee_meetings(self, committee: Committee) -> list[CommitteeMeeting]:
+        meetings = getattr(committee, "rag_recent_meetings", None)
+        if meetings is None:
             meetings = list(
-                committee.committeemeeting_set.select_related("session")
-                .prefetch_related("activities")
-                .order_by("-date")[:5]
+                self._recent_meetings_queryset(
+                    committee.committeemeeting_set.all()
+                )[:RECENT_MEETING_LIMIT]
             )
-        if not meetings:
-            return ""
-        lines = ["Recent meetings:"]
-        for meeting in meetings[:5]:
-            activities = ", ".join(a.name_en for a in meeting.activities.all())
-            activity_text = f" covering {activities}" if activities else ""
-            camera_text = " in camera" if meeting.in_camera else ""
-            lines.append(
-                f"- Meeting {meeting.number} on {meeting.date:%Y-%m-%d}{camera_text}{activity_text}."
+        return meetings[:RECENT_MEETING_LIMIT]
+
+    def _recent_meetings_queryset(self, queryset):
+        # Keep the FK ids so prefetching never falls back to per-row lookups.
+        return (
+            queryset.only(
+                "id", "number", "date", "in_camera", "session_id", "committee_id")
+            .prefetch_related(
+                Prefetch(
+                    "activities",
+                    queryset=CommitteeActivity.objects.only("id", "name_en"),
+                )
             )
-        return "\n".join(lines)
+            .order_by("-date")
+        )
 
-    def _committee_subcommittees_section(self, committee: Committee) -> str:
+    def _committee_subcommittees(self, committee: Committee) -> list[Committee]:
         manager = getattr(committee, "subcommittees", None)
         subcommittees = list(manager.all()) if manager is not None else [
         ]  # type: ignore[attr-defined]
         if not subcommittees:
             subcommittees = list(committee.subcommittees.all())
-        if not subcommittees:
-            return ""
-        names = ", ".join(
-            sub.short_name_en or sub.name_en for sub in subcommittees)
-        return f"Subcommittees: {names}."
+        return subcommittees
 
     def _prepare_chunk_text(self, text: str, index: int) -> str:
         """Ensure chunk text stays within embedding token limits."""
-        # Convert token ceiling to a conservative character limit to avoid exceeding OpenAI limits.
-        max_chars = MAX_EMBEDDING_TOKENS * TOKEN_TO_CHAR_RATIO
-        if len(text) <= max_chars:
+        if len(text) <= MAX_CHUNK_CHARS:
+            return text
+        truncated = truncate_tokens(text, MAX_EMBEDDING_TOKENS)
+        if truncated == text:
             return text
-        truncated = text[:max_chars]
         logger.info(
             "Truncated chunk %s to %s characters to satisfy embedding limits",
             index,
@@ -559,48 +761,90 @@ class RagIngestor:
         )
         return truncated
 
-    @transaction.atomic
-    def _upsert_chunk(
-        self,
-        *,
-        source_type: str,
-        source_identifier: str,
-        title: str,
-        content: str,
-        embedding: Sequence[float],
-    ) -> None:
-        chunk, _ = KnowledgeChunk.objects.update_or_create(
-            source_type=source_type,
-            source_identifier=source_identifier,
-            language=self._options.language,
-            jurisdiction=self._options.jurisdiction,
-            title=title,
-            defaults={
-                "content": content,
-                "embedding": list(embedding),
-            },
-        )
-        config = _search_config(self._options.language)
-        KnowledgeChunk.objects.filter(pk=chunk.pk).update(
-            search_document=SearchVector("title", weight="A", config=config)
-            + SearchVector("content", weight="B", config=config)
-        )
-        try:
-            self._vector_store.upsert(
-                point_id=chunk.pk,
-                vector=embedding,
-                payload={
-                    "source_type": source_type,
-                    "source_identifier": source_identifier,
-                    "jurisdiction": self._options.jurisdiction,
-                    "language": self._options.language,
-                    "title": title,
+    def _flush_ready(self, pipeline: EmbeddingPipeline) -> None:
+        """Persist finished records once a full page has accumulated.
+
+        Flushing during the run keeps memory bounded and means a later
+        failure only loses the records embedded since the last page.
+        """
+        if pipeline.pending_records >= UPSERT_PAGE_SIZE:
+            self._flush_chunks(pipeline.take_records())
+
+    def _flush_chunks(self, records: Sequence[ChunkRecord]) -> int:
+        """Persist a page of embedded chunks in one transaction, then index them in Qdrant."""
+        if not records:
+            return 0
+        # Later records win when truncated titles collide, matching the
+        # previous per-row update_or_create behaviour.
+        unique_records = {
+            (record.source_type, record.source_identifier, record.title): record
+            for record in records
+        }
+        rows = [
+            (
+                record.source_type,
+                record.source_identifier,
+                self._options.language,
+                self._options.jurisdiction,
+                record.title,
+                record.content,
+                record.content_hash,
+                pack_vector(record.embedding),
+            )
+            for record in unique_records.values()
+        ]
+        with transaction.atomic():
+            pks = self._upsert_rows(rows)
+            self._cache_embeddings(unique_records.values())
+        points = [
+            (
+                pks[key],
+                record.embedding,
+                {
+                    **self._payload_scope,
+                    "source_type": record.source_type,
+                    "source_identifier": record.source_identifier,
+                    "title": record.title,
                 },
             )
-            logger.info("Persisted chunk %s for %s", chunk.pk, title)
-        except Exception as exc:  # pragma: no cover - network failure guard
+            for key, record in unique_records.items()
+        ]
+        try:
+            self._vector_store.upsert_many(points)
+        except Exception as exc:  # network failure guard
             logger.warning(
-                "Failed to upsert chunk %s into Qdrant: %s", chunk.pk, exc)
+                "Failed to upsert %s chunk(s) into Qdrant; they will be re-queued on the next sync: %s",
+                len(points),
+                exc,
+            )
+            # Without a stored hash the next run treats these chunks as
+            # changed; the EmbeddingCache still spares the re-embedding.
+            KnowledgeChunk.objects.filter(pk__in=pks.values()).update(
+                content_hash="")
+        logger.info("Persisted %s chunk(s)", len(pks))
+        return len(pks)
+
+    def _upsert_rows(
+        self,
+        rows: Sequence[tuple[object, ...]],
+    ) -> dict[tuple[str, str, str], int]:
+        """Upsert chunk rows page by page, returning pks keyed by chunk identity."""
+        pks: dict[tuple[str, str, str], int] = {}
+        table = connection.ops.quote_name(KnowledgeChunk._meta.db_table)
+        with connection.cursor() as cursor:
+            for start in range(0, len(rows), UPSERT_PAGE_SIZE):
+                page = rows[start: start + UPSERT_PAGE_SIZE]
+                sql = SQL_UPSERT_CHUNKS.format(
+                    table=table,
+                    values=", ".join([ROW_TEMPLATE] * len(page)),
+                )
+                params: list[object] = []
+                for row in page:
+                    params.extend(row)
+                cursor.execute(sql, params)
+                for pk, source_type, source_identifier, title in cursor.fetchall():
+                    pks[(source_type, source_identifier, title)] = pk
+        return pks
 
     def _normalize_options(self, options: IngestOptions) -> IngestOptions:
         return IngestOptions(
@@ -611,4 +855,5 @@ class RagIngestor:
             member_limit=options.member_limit,
             committee_limit=options.committee_limit,
             chunk_size=options.chunk_size,
+            corpus_workers=options.corpus_workers,
         )
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rag", "0002_reset_embedding_column"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="knowledgechunk",
+            name="content_hash",
+            field=models.CharField(blank=True, default="", max_length=32),
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+
+
+SQL_CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION rag_knowledgechunk_search_document()
+RETURNS trigger AS $$
+DECLARE
+    config regconfig := CASE
+        WHEN lower(NEW.language) LIKE 'fr%' THEN 'french'::regconfig
+        ELSE 'english'::regconfig
+    END;
+BEGIN
+    NEW.search_document :=
+        setweight(to_tsvector(config, COALESCE(NEW.title, '')), 'A')
+        || setweight(to_tsvector(config, COALESCE(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS rag_knowledgechunk_search_document
+    ON rag_knowledgechunk;
+CREATE TRIGGER rag_knowledgechunk_search_document
+    BEFORE INSERT OR UPDATE ON rag_knowledgechunk
+    FOR EACH ROW EXECUTE FUNCTION rag_knowledgechunk_search_document();
+
+UPDATE rag_knowledgechunk SET search_document = NULL
+    WHERE search_document IS NULL;
+"""
+
+SQL_DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS rag_knowledgechunk_search_document
+    ON rag_knowledgechunk;
+DROP FUNCTION IF EXISTS rag_knowledgechunk_search_document();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rag", "0003_knowledgechunk_content_hash"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=SQL_CREATE_TRIGGER, reverse_sql=SQL_DROP_TRIGGER),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rag", "0004_knowledgechunk_search_trigger"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmbeddingCache",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True,
+                 primary_key=True, serialize=False, verbose_name="ID")),
+                ("content_hash", models.CharField(max_length=32)),
+                ("model", models.CharField(max_length=64)),
+                ("vector", models.JSONField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "unique_together": {("content_hash", "model")},
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+from django.db import migrations
+
+import parliament.rag.models
+
+
+# float4send emits big-endian float32, matching pack_vector, so existing JSON
+# vectors convert in place without a Python round-trip.
+SQL_CONVERT_EMBEDDINGS = """
+ALTER TABLE rag_knowledgechunk
+    ADD COLUMN embedding_f32 bytea NOT NULL DEFAULT ''::bytea;
+UPDATE rag_knowledgechunk AS chunk
+   SET embedding_f32 = packed.data
+  FROM (
+      SELECT id,
+             string_agg(float4send(element::float4), ''::bytea
+                        ORDER BY position) AS data
+        FROM rag_knowledgechunk,
+             jsonb_array_elements_text(embedding)
+             WITH ORDINALITY AS elements (element, position)
+       WHERE jsonb_typeof(embedding) = 'array'
+       GROUP BY id
+  ) AS packed
+ WHERE chunk.id = packed.id;
+ALTER TABLE rag_knowledgechunk DROP COLUMN embedding;
+ALTER TABLE rag_knowledgechunk RENAME COLUMN embedding_f32 TO embedding;
+
+TRUNCATE rag_embeddingcache;
+ALTER TABLE rag_embeddingcache
+    ALTER COLUMN vector TYPE bytea USING ''::bytea;
+"""
+
+# Reversal keeps the schema usable but drops stored vectors; run
+# verify_embeddings afterwards to regenerate them.
+SQL_RESTORE_JSON = """
+ALTER TABLE rag_knowledgechunk DROP COLUMN embedding;
+ALTER TABLE rag_knowledgechunk
+    ADD COLUMN embedding jsonb NOT NULL DEFAULT '[]'::jsonb;
+
+TRUNCATE rag_embeddingcache;
+ALTER TABLE rag_embeddingcache
+    ALTER COLUMN vector TYPE jsonb USING '[]'::jsonb;
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rag", "0005_embeddingcache"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql=SQL_CONVERT_EMBEDDINGS, reverse_sql=SQL_RESTORE_JSON),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="knowledgechunk",
+                    name="embedding",
+                    field=parliament.rag.models.Float32VectorField(
+                        blank=True, default=list),
+                ),
+                migrations.AlterField(
+                    model_name="embeddingcache",
+                    name="vector",
+                    field=parliament.rag.models.Float32VectorField(
+                        blank=True, default=list),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+
+# Embedding-only writes (integrity repairs, re-embeds) leave the text columns
+# alone, so restrict the UPDATE trigger to the columns it reads.
+SQL_NARROW_TRIGGER = """
+DROP TRIGGER IF EXISTS rag_knowledgechunk_search_document
+    ON rag_knowledgechunk;
+CREATE TRIGGER rag_knowledgechunk_search_document
+    BEFORE INSERT OR UPDATE OF title, content, language ON rag_knowledgechunk
+    FOR EACH ROW EXECUTE FUNCTION rag_knowledgechunk_search_document();
+"""
+
+SQL_WIDEN_TRIGGER = """
+DROP TRIGGER IF EXISTS rag_knowledgechunk_search_document
+    ON rag_knowledgechunk;
+CREATE TRIGGER rag_knowledgechunk_search_document
+    BEFORE INSERT OR UPDATE ON rag_knowledgechunk
+    FOR EACH ROW EXECUTE FUNCTION rag_knowledgechunk_search_document();
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("rag", "0006_float32_embeddings"),
+    ]
+
+    operations = [
+        migrations.RunSQL(sql=SQL_NARROW_TRIGGER, reverse_sql=SQL_WIDEN_TRIGGER),
+    ]
@@ -1,5 +1,9 @@
 """RAG-related Django models."""
 
+import sys
+from array import array
+from base64 import b64encode
+
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
 from django.db import models
@@ -13,6 +17,51 @@ class KnowledgeSource(models.TextChoices):
     VOTE = "vote", "Vote"
 
 
+def pack_vector(vector) -> bytes:
+    """Pack floats as big-endian float32, the byte order of ``float4send``."""
+    packed = array("f", vector)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vector(data) -> list[float]:
+    packed = array("f")
+    packed.frombytes(data)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed.tolist()
+
+
+class Float32VectorField(models.BinaryField):
+    """Embedding vector stored as packed float32 bytes, exposed as a list."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("default", list)
+        kwargs.setdefault("blank", True)
+        super().__init__(*args, **kwargs)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return unpack_vector(value)
+
+    def to_python(self, value):
+        if isinstance(value, str):
+            value = super().to_python(value)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return unpack_vector(value)
+        return value
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if value is not None and not isinstance(value, (bytes, bytearray, memoryview)):
+            value = pack_vector(value)
+        return super().get_db_prep_value(value, connection, prepared)
+
+    def value_to_string(self, obj):
+        return b64encode(pack_vector(self.value_from_object(obj))).decode("ascii")
+
+
 class KnowledgeChunk(models.Model):
     """Embedding chunks sourced from parliamentary content."""
 
@@ -23,8 +72,9 @@ class KnowledgeChunk(models.Model):
     language = models.CharField(max_length=8, default="en")
     title = models.CharField(max_length=255)
     content = models.TextField()
+    content_hash = models.CharField(max_length=32, blank=True, default="")
     search_document = SearchVectorField(null=True)
-    embedding = models.JSONField(default=list, blank=True)
+    embedding = Float32VectorField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -39,3 +89,18 @@ class KnowledgeChunk(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover - debug helper
         return f"{self.source_type}:{self.source_identifier} ({self.language})"
+
+
+class EmbeddingCache(models.Model):
+    """Embedding vectors reused across runs for identical chunk text."""
+
+    content_hash = models.CharField(max_length=32)
+    model = models.CharField(max_length=64)
+    vector = Float32VectorField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ("content_hash", "model")
+
+    def __str__(self) -> str:  # pragma: no cover - debug helper
+        return f"{self.model}:{self.content_hash}"
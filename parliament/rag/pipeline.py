@@ -0,0 +1,265 @@
+"""Bounded producer/consumer pipeline for embedding ingestion chunks."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+EMBED_BATCH_SIZE = 64
+MAX_INFLIGHT_BATCHES = 4
+SUBMIT_JITTER_SECONDS = 0.05
+VECTOR_CACHE_SIZE = 4096
+
+__all__ = ["ChunkRecord", "EmbeddingPipeline", "PendingChunk", "VectorCache"]
+
+
+# MARK: Records
+
+@dataclass(frozen=True)
+class PendingChunk:
+    """Prepared chunk text waiting for an embedding."""
+
+    source_type: str
+    source_identifier: str
+    title: str
+    content: str
+    content_hash: str = ""
+    embedding: Sequence[float] | None = None  # set on embedding-cache hits
+
+
+@dataclass(frozen=True)
+class ChunkRecord:
+    """Embedded chunk awaiting persistence."""
+
+    source_type: str
+    source_identifier: str
+    title: str
+    content: str
+    embedding: Sequence[float]
+    content_hash: str = ""
+    cached: bool = False
+
+
+# MARK: Cache
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so reflowed boilerplate shares one cache key."""
+    return " ".join(text.split())
+
+
+class VectorCache:
+    """In-process LRU of recent embeddings keyed by normalized text.
+
+    Only the pipeline worker thread reads and writes the cache, and pipelines
+    sharing one cache run one after another, so no locking is needed.
+    """
+
+    def __init__(self, maxsize: int = VECTOR_CACHE_SIZE) -> None:
+        self._maxsize = max(1, maxsize)
+        self._entries: OrderedDict[str, Sequence[float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Sequence[float] | None:
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+        return vector
+
+    def put(self, key: str, vector: Sequence[float]) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+# MARK: Pipeline
+
+class EmbeddingPipeline:
+    """Embed chunks on a worker thread while the caller keeps loading sources.
+
+    Chunks submitted by the producer are grouped into micro-batches that may
+    span several sources. Up to ``max_inflight`` batches are embedded
+    concurrently; results are collected in submission order. The queue is
+    bounded so a slow embedding endpoint applies backpressure to corpus
+    building instead of buffering everything in memory.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[list[str]], Sequence[Sequence[float]]],
+        *,
+        batch_size: int = EMBED_BATCH_SIZE,
+        max_pending: int | None = None,
+        max_inflight: int = MAX_INFLIGHT_BATCHES,
+        cache: VectorCache | None = None,
+    ) -> None:
+        self._embed = embed
+        self._cache = cache
+        self._batch_size = max(1, batch_size)
+        self._max_inflight = max(1, max_inflight)
+        self._queue: queue.Queue[PendingChunk | None] = queue.Queue(
+            maxsize=max_pending or 4 * self._batch_size
+        )
+        self._records: list[ChunkRecord] = []
+        # Guards _records so the producer can take finished records mid-run.
+        self._records_lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._worker = threading.Thread(
+            target=self._run, name="rag-embed", daemon=True)
+        self._closed = False
+        self._stopped = False  # worker has taken the close sentinel
+
+    def __enter__(self) -> "EmbeddingPipeline":
+        self._worker.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        self.close(raise_errors=exc_type is None)
+
+    # MARK: Producer API
+
+    def submit(self, chunk: PendingChunk) -> None:
+        if self._error is not None:
+            raise self._error
+        self._queue.put(chunk)
+
+    def close(self, *, raise_errors: bool = True) -> list[ChunkRecord]:
+        """Drain outstanding chunks and return every embedded record."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._worker.join()
+        if raise_errors and self._error is not None:
+            raise self._error
+        return self._records
+
+    def take_records(self) -> list[ChunkRecord]:
+        """Hand over the records embedded so far so they can be persisted."""
+        with self._records_lock:
+            records, self._records = self._records, []
+        return records
+
+    @property
+    def records(self) -> list[ChunkRecord]:
+        return self._records
+
+    @property
+    def pending_records(self) -> int:
+        return len(self._records)
+
+    # MARK: Worker
+
+    def _run(self) -> None:
+        try:
+            self._consume()
+        except BaseException as exc:  # surfaced to the producer on close
+            logger.warning("Embedding worker failed: %s", exc)
+            if self._error is None:
+                self._error = exc
+            # Keep draining so a producer blocked on put() can reach close().
+            while not self._stopped:
+                self._stopped = self._queue.get() is None
+
+    def _consume(self) -> None:
+        inflight: deque[tuple[list[PendingChunk], list[str], Future]] = deque()
+        with ThreadPoolExecutor(
+            max_workers=self._max_inflight,
+            thread_name_prefix="rag-embed-batch",
+        ) as executor:
+            batch: list[PendingChunk] = []
+            while True:
+                chunk = self._queue.get()
+                if chunk is None:
+                    self._stopped = True
+                    break
+                if self._error is not None:
+                    continue  # keep draining so producers never block
+                batch.append(chunk)
+                if len(batch) >= self._batch_size:
+                    self._submit_batch(executor, inflight, batch)
+                    batch = []
+            if batch and self._error is None:
+                self._submit_batch(executor, inflight, batch)
+            while inflight:
+                self._collect(*inflight.popleft())
+
+    def _submit_batch(
+        self,
+        executor: ThreadPoolExecutor,
+        inflight: deque[tuple[list[PendingChunk], list[str], Future]],
+        batch: list[PendingChunk],
+    ) -> None:
+        while len(inflight) >= self._max_inflight:
+            self._collect(*inflight.popleft())
+        if inflight:
+            # Spread concurrent requests slightly to avoid 429 bursts.
+            time.sleep(random.uniform(0, SUBMIT_JITTER_SECONDS))
+        if self._cache is not None:
+            batch[:] = [self._from_cache(chunk) for chunk in batch]
+        # Boilerplate chunks repeat; embed each distinct text once.
+        pending: dict[str, str] = {}
+        for chunk in batch:
+            if chunk.embedding is None:
+                pending.setdefault(normalize_text(chunk.content), chunk.content)
+        if pending:
+            future = executor.submit(self._embed, list(pending.values()))
+        else:
+            # Every chunk was a cache hit; keep its slot in the ordering.
+            future = Future()
+            future.set_result([])
+        inflight.append((batch, list(pending), future))
+
+    def _collect(
+        self, batch: list[PendingChunk], texts: list[str], future: Future
+    ) -> None:
+        try:
+            vectors = future.result()
+        except BaseException as exc:  # surfaced to the producer on close
+            logger.warning("Embedding batch of %s chunk(s) failed: %s",
+                           len(batch), exc)
+            if self._error is None:
+                self._error = exc
+            return
+        if self._error is not None:
+            return
+        fresh = dict(zip(texts, vectors))
+        if self._cache is not None:
+            for text, vector in fresh.items():
+                self._cache.put(text, vector)
+        records: list[ChunkRecord] = []
+        for chunk in batch:
+            cached = chunk.embedding is not None
+            vector = (chunk.embedding if cached
+                      else fresh.get(normalize_text(chunk.content)))
+            if vector is None:
+                continue
+            records.append(
+                ChunkRecord(
+                    source_type=chunk.source_type,
+                    source_identifier=chunk.source_identifier,
+                    title=chunk.title,
+                    content=chunk.content,
+                    embedding=vector,
+                    content_hash=chunk.content_hash,
+                    cached=cached,
+                )
+            )
+        with self._records_lock:
+            self._records.extend(records)
+
+    def _from_cache(self, chunk: PendingChunk) -> PendingChunk:
+        if chunk.embedding is not None:
+            return chunk
+        vector = self._cache.get(normalize_text(chunk.content))
+        return chunk if vector is None else replace(chunk, embedding=vector)
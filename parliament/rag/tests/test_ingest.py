@@ -0,0 +1,357 @@
+"""Tests for the RAG ingestion write path."""
+
+from __future__ import annotations
+
+import datetime
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from parliament.committees.models import (
+    Committee,
+    CommitteeActivity,
+    CommitteeMeeting,
+)
+from parliament.core.models import Session
+from parliament.hansards.models import Document, Statement
+
+from parliament.rag.corpus import MemberProfile, build_member_corpus, join_sections
+from parliament.rag.ingest import IngestOptions, RagIngestor, _truncate_title
+from parliament.rag.models import EmbeddingCache, KnowledgeChunk, KnowledgeSource
+from parliament.rag.pipeline import EmbeddingPipeline, PendingChunk, VectorCache
+from src.services.rag.chunker import truncate_to_token_limit, truncate_tokens
+
+
+class DummyEmbeddingService:
+    """Test double returning deterministic two-dimensional vectors."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts):  # type: ignore[no-untyped-def]
+        batch = list(texts)
+        self.calls.append(batch)
+        return [[float(len(text)), 1.0] for text in batch]
+
+
+class DummyVectorStore:
+    """Test double recording upserted points."""
+
+    def __init__(self) -> None:
+        self.upserts: list[tuple[int, list[float], dict[str, object]]] = []
+
+    def upsert_many(self, points):  # type: ignore[no-untyped-def]
+        self.upserts.extend(
+            (int(point_id), list(vector), dict(payload))
+            for point_id, vector, payload in points
+        )
+
+
+class RagIngestorWriteTests(TestCase):
+    """Validate chunk persistence for the ingestion pipeline."""
+
+    def setUp(self) -> None:  # pragma: no cover - Django contract
+        self.embedding_service = DummyEmbeddingService()
+        self.vector_store = DummyVectorStore()
+        self.ingestor = RagIngestor(
+            self.embedding_service,
+            IngestOptions(chunk_size=40),
+            vector_store=self.vector_store,
+        )
+
+    def _index(self, *texts: str):  # type: ignore[no-untyped-def]
+        with self.ingestor._embedding_pipeline() as pipeline:
+            for number, text in enumerate(texts, start=1):
+                self.ingestor._index_chunks(
+                    pipeline,
+                    source_type=KnowledgeSource.BILL,
+                    source_identifier=f"bill:test-{number}",
+                    base_title=f"Bill C-{number}",
+                    raw_text=text,
+                )
+        return pipeline.records
+
+    def test_flush_persists_chunks_with_search_document(self) -> None:
+        records = self._index(
+            "First paragraph about taxes.\n\nSecond paragraph about trade.")
+
+        persisted = self.ingestor._flush_chunks(records)
+
+        chunks = list(KnowledgeChunk.objects.order_by("title"))
+        self.assertEqual(persisted, len(records))
+        self.assertEqual(len(chunks), len(records))
+        self.assertEqual(len(self.embedding_service.calls), 1)
+        self.assertTrue(all(chunk.search_document for chunk in chunks))
+        self.assertEqual(chunks[0].embedding, list(records[0].embedding))
+        self.assertEqual(
+            {item[0] for item in self.vector_store.upserts},
+            {chunk.pk for chunk in chunks},
+        )
+
+    def test_search_document_trigger_uses_row_language(self) -> None:
+        chunk = KnowledgeChunk.objects.create(
+            source_type=KnowledgeSource.BILL, source_identifier="bill:fr",
+            language="fr", title="Projet de loi", content="Les impôts fédéraux.")
+
+        chunk.refresh_from_db()
+
+        self.assertIn("'fédéral'", str(chunk.search_document))
+
+    def test_flush_updates_existing_chunks_in_place(self) -> None:
+        self.ingestor._flush_chunks(self._index("Original text."))
+        original = KnowledgeChunk.objects.get()
+
+        self.ingestor._flush_chunks(self._index("Revised text."))
+
+        updated = KnowledgeChunk.objects.get()
+        self.assertEqual(updated.pk, original.pk)
+        self.assertEqual(updated.content, "Revised text.")
+
+    def test_pipeline_batches_chunks_across_sources(self) -> None:
+        records = self._index("Taxes.", "Trade.", "Health.")
+
+        self.assertEqual(len(self.embedding_service.calls), 1)
+        self.assertEqual(
+            [record.source_identifier for record in records],
+            ["bill:test-1", "bill:test-2", "bill:test-3"],
+        )
+
+    def test_pipeline_embeds_duplicate_texts_once(self) -> None:
+        records = self._index("Same.", "Same.", "Other.")
+
+        self.assertEqual(self.embedding_service.calls, [["Same.", "Other."]])
+        self.assertEqual(
+            [record.embedding[0] for record in records], [5.0, 5.0, 6.0])
+
+    def test_vector_cache_reuses_reflowed_text_across_pipelines(self) -> None:
+        self._index("The House resumed consideration.")
+        self.embedding_service.calls.clear()
+
+        with self.ingestor._embedding_pipeline() as pipeline:
+            self.ingestor._index_chunks(
+                pipeline, source_type=KnowledgeSource.DEBATE,
+                source_identifier="debate:1", base_title="Hansard",
+                raw_text="The House  resumed\tconsideration.")
+
+        self.assertEqual(self.embedding_service.calls, [])
+        self.assertTrue(pipeline.records[0].cached)
+
+    def test_pipeline_surfaces_embedding_errors(self) -> None:
+        def fail(texts):  # type: ignore[no-untyped-def]
+            raise RuntimeError("embedding unavailable")
+
+        pipeline = EmbeddingPipeline(fail, batch_size=1, max_pending=1)
+        with self.assertRaises(RuntimeError):
+            with pipeline:
+                for index in range(5):
+                    self.ingestor._index_chunks(
+                        pipeline,
+                        source_type=KnowledgeSource.BILL,
+                        source_identifier=f"bill:{index}",
+                        base_title="Bill",
+                        raw_text="Body text.",
+                    )
+        self.assertEqual(pipeline.records, [])
+
+    def test_pipeline_surfaces_worker_errors_without_blocking(self) -> None:
+        class BrokenCache(VectorCache):
+            def get(self, key):  # type: ignore[no-untyped-def]
+                raise RuntimeError("cache unavailable")
+
+        pipeline = EmbeddingPipeline(
+            self.embedding_service.embed, batch_size=1, max_pending=1,
+            cache=BrokenCache())
+        with self.assertRaises(RuntimeError):
+            with pipeline:
+                for index in range(5):
+                    pipeline._queue.put(PendingChunk(
+                        KnowledgeSource.BILL, f"bill:{index}", "Bill", "Body."))
+        self.assertFalse(pipeline._worker.is_alive())
+        self.assertEqual(pipeline.records, [])
+
+    def test_pipeline_preserves_order_with_concurrent_batches(self) -> None:
+        pipeline = EmbeddingPipeline(
+            self.embedding_service.embed, batch_size=1, max_inflight=3)
+        with pipeline:
+            for index in range(6):
+                self.ingestor._index_chunks(
+                    pipeline,
+                    source_type=KnowledgeSource.BILL,
+                    source_identifier=f"bill:{index}",
+                    base_title="Bill",
+                    raw_text="x" * (index + 1),
+                )
+
+        self.assertEqual(len(self.embedding_service.calls), 6)
+        self.assertEqual(
+            [record.embedding[0] for record in pipeline.records],
+            [float(index + 1) for index in range(6)],
+        )
+
+    def test_hansard_sync_reads_prefetched_statements(self) -> None:
+        session = Session.objects.create(
+            id="44-1", name="44th Parliament, 1st Session",
+            start=datetime.date(2021, 11, 22))
+        document = Document.objects.create(
+            document_type=Document.DEBATE, session=session,
+            date=datetime.date(2024, 2, 1), number="270", source_id=12345)
+        Statement.objects.bulk_create(
+            Statement(
+                document=document, time=timezone.now(), sequence=sequence,
+                slug=f"statement-{sequence}", wordcount=3,
+                content_en=content, procedural=procedural)
+            for sequence, (content, procedural) in enumerate(
+                [("<p>Opening remarks.</p>", True),
+                 ("<p>Debate on trade.</p>", False)]
+            )
+        )
+
+        self.ingestor.sync_recent_hansards()
+
+        chunk = KnowledgeChunk.objects.get(source_type=KnowledgeSource.DEBATE)
+        self.assertEqual(chunk.content, "Debate on trade.")
+
+    def test_join_sections_skips_empty_sections(self) -> None:
+        corpus = join_sections((
+            iter(["Summary."]),
+            iter([]),
+            iter(["History:", "- First.", "- Second."]),
+        ))
+
+        self.assertEqual(corpus, "Summary.\n\nHistory:\n- First.\n- Second.")
+
+    def test_truncate_title_matches_truncator_length(self) -> None:
+        self.assertEqual(_truncate_title("Bill C-1 [1]"), "Bill C-1 [1]")
+        truncated = _truncate_title("x" * 300)
+        self.assertEqual(len(truncated), 240)
+        self.assertTrue(truncated.endswith("x…"))
+
+    def test_long_titles_keep_distinct_chunk_suffixes(self) -> None:
+        with self.ingestor._embedding_pipeline() as pipeline:
+            self.ingestor._index_chunks(
+                pipeline, source_type=KnowledgeSource.BILL,
+                source_identifier="bill:long", base_title="T" * 300,
+                raw_text="First paragraph here.\nSecond paragraph here.")
+
+        titles = [record.title for record in pipeline.records]
+        self.assertEqual(len(titles), 2)
+        self.assertTrue(titles[0].endswith("… [1]"))
+        self.assertTrue(titles[1].endswith("… [2]"))
+        self.assertTrue(all(len(title) <= 240 for title in titles))
+
+    def test_truncate_to_token_limit_cuts_at_word_boundary(self) -> None:
+        text = "alpha beta gamma delta"
+
+        truncated = truncate_to_token_limit(text, 3)
+
+        self.assertEqual(truncated, "alpha beta")
+        self.assertEqual(truncate_to_token_limit(text, 10), text)
+        self.assertEqual(truncate_tokens(text, 10), text)
+
+    def test_committee_sync_keeps_five_most_recent_meetings(self) -> None:
+        session = Session.objects.create(
+            id="44-1", name="44th Parliament, 1st Session",
+            start=datetime.date(2021, 11, 22))
+        committee = Committee.objects.create(
+            name_en="Finance", short_name_en="FINA", slug="fina", display=True)
+        activity = CommitteeActivity.objects.create(
+            committee=committee, name_en="Budget", study=True)
+        for number in range(1, 8):
+            meeting = CommitteeMeeting.objects.create(
+                committee=committee, session=session, number=number,
+                date=datetime.date(2024, 1, number), start_time=datetime.time(9))
+            meeting.activities.add(activity)
+
+        RagIngestor(
+            self.embedding_service, vector_store=self.vector_store
+        ).sync_committees()
+
+        corpus = KnowledgeChunk.objects.get().content
+        self.assertIn("- Meeting 7 on 2024-01-07 covering Budget.", corpus)
+        self.assertIn("- Meeting 3 on 2024-01-03 covering Budget.", corpus)
+        self.assertNotIn("Meeting 2 ", corpus)
+
+    def test_corpus_workers_build_same_corpora_as_inline(self) -> None:
+        profiles = [
+            (f"member:{index}", name, MemberProfile(
+                name=name, services=(), candidacies=(),
+                info={"twitter": (f"@{index}",)}))
+            # Enough profiles to span several worker windows.
+            for index, name in enumerate(["Ada", "Grace", "Linus"] * 14)
+        ]
+        pooled = RagIngestor(
+            self.embedding_service,
+            IngestOptions(corpus_workers=2),
+            vector_store=self.vector_store,
+        )
+
+        inline = list(self.ingestor._map_corpora(build_member_corpus, profiles))
+        parallel = list(pooled._map_corpora(build_member_corpus, profiles))
+
+        self.assertEqual(parallel, inline)
+        self.assertEqual(
+            inline[0][2],
+            "Ada is a Canadian political figure.\n\n"
+            "Additional details:\n- twitter: @0",
+        )
+
+    def test_embedding_cache_serves_repeated_text(self) -> None:
+        self.embedding_service.model = "test-model"
+        ingestor = RagIngestor(
+            self.embedding_service, vector_store=self.vector_store)
+        with ingestor._embedding_pipeline() as pipeline:
+            ingestor._index_chunks(
+                pipeline, source_type=KnowledgeSource.BILL,
+                source_identifier="bill:a", base_title="Bill A",
+                raw_text="Shared text.")
+        ingestor._flush_chunks(pipeline.records)
+        self.embedding_service.calls.clear()
+
+        with ingestor._embedding_pipeline() as pipeline:
+            ingestor._index_chunks(
+                pipeline, source_type=KnowledgeSource.BILL,
+                source_identifier="bill:b", base_title="Bill B",
+                raw_text="Shared text.")
+
+        self.assertEqual(self.embedding_service.calls, [])
+        self.assertEqual(EmbeddingCache.objects.count(), 1)
+        self.assertEqual(pipeline.records[0].embedding, [12.0, 1.0])
+        self.assertTrue(pipeline.records[0].cached)
+
+    def test_unchanged_chunks_are_not_reembedded(self) -> None:
+        self.ingestor._flush_chunks(self._index("Stable text."))
+        self.embedding_service.calls.clear()
+
+        records = self._index("Stable text.")
+
+        self.assertEqual(records, [])
+        self.assertEqual(self.embedding_service.calls, [])
+
+    def test_full_pages_are_flushed_before_the_run_ends(self) -> None:
+        with self.ingestor._embedding_pipeline() as pipeline:
+            for text in ("Taxes.", "Trade."):
+                self.ingestor._index_chunks(
+                    pipeline, source_type=KnowledgeSource.BILL,
+                    source_identifier=f"bill:{text}", base_title="Bill",
+                    raw_text=text)
+        with mock.patch("parliament.rag.ingest.UPSERT_PAGE_SIZE", 2):
+            self.ingestor._flush_ready(pipeline)
+
+        self.assertEqual(KnowledgeChunk.objects.count(), 2)
+        self.assertEqual(pipeline.take_records(), [])
+
+    def test_qdrant_failures_requeue_chunks_on_next_sync(self) -> None:
+        def fail(points):  # type: ignore[no-untyped-def]
+            raise ConnectionError("qdrant unavailable")
+
+        with mock.patch.object(self.vector_store, "upsert_many", fail):
+            self.ingestor._flush_chunks(self._index("Pending text."))
+
+        self.assertEqual(KnowledgeChunk.objects.get().content_hash, "")
+        records = self._index("Pending text.")
+        self.ingestor._flush_chunks(records)
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(len(self.vector_store.upserts), 1)
+        self.assertTrue(KnowledgeChunk.objects.get().content_hash)
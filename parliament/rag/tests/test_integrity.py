@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest import mock
+
 from django.test import TestCase
 
 from parliament.rag.models import KnowledgeChunk, KnowledgeSource
@@ -83,6 +85,28 @@ class EmbeddingIntegrityServiceTests(TestCase):
         self.assertEqual({item[0]
                          for item in self.vector_store.upserts}, {chunk.id})
 
+    def test_scans_scope_across_pages(self) -> None:
+        first = self._create_chunk(has_embedding=True)
+        second = KnowledgeChunk.objects.create(
+            source_type=KnowledgeSource.BILL,
+            source_identifier="bill:test",
+            jurisdiction="canada-federal",
+            language="en",
+            title="Second Chunk",
+            content="More text",
+            embedding=[],
+        )
+
+        with mock.patch("src.services.rag.integrity.SCAN_PAGE_SIZE", 1):
+            result = self.service.verify_scope(
+                jurisdiction="canada-federal", language="en")
+
+        self.assertEqual(result.total_chunks, 2)
+        self.assertEqual(result.reembedded, 1)
+        self.assertEqual(result.reindexed, 1)
+        self.assertEqual({item[0] for item in self.vector_store.upserts},
+                         {first.id, second.id})
+
     def test_verified_returns_true_when_no_repairs_needed(self) -> None:
         chunk = self._create_chunk(has_embedding=True)
         # Pretend the vector already exists to avoid reindexing.
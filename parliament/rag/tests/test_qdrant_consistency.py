@@ -7,7 +7,11 @@ from typing import ClassVar
 from django.test import TestCase
 
 from parliament.rag.models import KnowledgeChunk
-from src.services.rag.vector_store import QdrantConfig, QdrantVectorStore
+from src.services.rag.vector_store import (
+    RETRIEVE_BATCH_SIZE,
+    QdrantConfig,
+    QdrantVectorStore,
+)
 
 
 class KnowledgeChunkVectorConsistencyTests(TestCase):
@@ -33,18 +37,26 @@ class KnowledgeChunkVectorConsistencyTests(TestCase):
             reason = self._config_error or "Qdrant configuration missing"
             self.skipTest(f"Qdrant not configured: {reason}")
 
-        queryset = KnowledgeChunk.objects.order_by(
-            "id").values_list("id", flat=True)
-        self._chunk_ids = list(queryset)
-        if not self._chunk_ids:
+        if not KnowledgeChunk.objects.exists():
             self.skipTest(
                 "No KnowledgeChunk records available for verification.")
 
         self._vector_store = QdrantVectorStore(self._qdrant_config)
 
+    def _chunk_id_pages(self):  # type: ignore[no-untyped-def]
+        queryset = KnowledgeChunk.objects.order_by(
+            "id").values_list("id", flat=True)
+        last_id = 0
+        while page := list(queryset.filter(id__gt=last_id)[:RETRIEVE_BATCH_SIZE]):
+            yield page
+            last_id = page[-1]
+
     def test_all_chunks_have_vector_records(self) -> None:
-        existing_ids = self._vector_store.existing_ids(self._chunk_ids)
-        missing_ids = sorted(set(self._chunk_ids) - existing_ids)
+        missing_ids: list[int] = []
+        for page in self._chunk_id_pages():
+            existing_ids = self._vector_store.existing_ids(page)
+            missing_ids.extend(
+                identifier for identifier in page if identifier not in existing_ids)
         if missing_ids:
             preview_limit = 20
             sample = ", ".join(str(identifier)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from dataclasses import dataclass
 from typing import Iterable
 
@@ -17,6 +18,8 @@ from src.services.rag.language import normalize_language
 from src.services.rag.retriever import HybridRetriever
 from src.services.nia.client import NiaClient, NiaConfig
 
+_local = threading.local()
+
 
 @dataclass(frozen=True)
 class RagRequest:
@@ -39,6 +42,20 @@ class RagRequest:
         return RagRequest(query=str(last["content"]), jurisdiction=jurisdiction, language=language)
 
 
+def _nia_client(config: NiaConfig) -> NiaClient:
+    """Return this thread's NIA client, rebuilding it if the config changed.
+
+    Clients are per thread because NiaClient wraps a requests.Session, which
+    is not thread-safe; reusing one per thread keeps its connections alive.
+    """
+    client = getattr(_local, "nia_client", None)
+    if client is None or _local.nia_config != config:
+        client = NiaClient(config)
+        _local.nia_client = client
+        _local.nia_config = config
+    return client
+
+
 @method_decorator(csrf_exempt, name="dispatch")
 class RagContextView(JSONView):
     """Return retrieval-augmented snippets for chat."""
@@ -94,5 +111,4 @@ class RagContextView(JSONView):
         config = NiaConfig.from_env()
         if not config:
             return []
-        client = NiaClient(config)
-        return list(client.enrich(query))
+        return list(_nia_client(config).enrich(query))
@@ -4,15 +4,24 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import os
 import sys
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence
 
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ModuleNotFoundError:  # pragma: no cover - exercised when not installed
+    uvloop = None  # type: ignore[assignment]
+
+
+ID_STREAM_CHUNK_SIZE = 10_000
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
@@ -62,7 +71,8 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--jurisdiction",
-        help="Filter chunks by jurisdiction (defaults to all)",
+        action="append",
+        help="Filter chunks by jurisdiction; repeat to check several (defaults to all)",
     )
     parser.add_argument(
         "--language",
@@ -97,7 +107,8 @@ def gather_chunk_ids(
     jurisdiction: str | None,
     language: str | None,
     limit: int,
-) -> list[int]:
+) -> Iterator[int]:
+    """Stream ids in ascending order from a server-side cursor."""
     from parliament.rag.models import KnowledgeChunk
 
     queryset = KnowledgeChunk.objects.order_by("id")
@@ -107,7 +118,8 @@ def gather_chunk_ids(
         queryset = queryset.filter(language=language)
     if limit and limit > 0:
         queryset = queryset[:limit]
-    return list(queryset.values_list("id", flat=True))
+    return queryset.values_list("id", flat=True).iterator(
+        chunk_size=ID_STREAM_CHUNK_SIZE)
 
 
 def build_vector_store():  # type: ignore[no-any-unimported]
@@ -117,22 +129,129 @@ def build_vector_store():  # type: ignore[no-any-unimported]
     return QdrantVectorStore(config)
 
 
+def _id_pages(chunk_ids: Iterable[int], size: int) -> Iterator[list[int]]:
+    iterator = iter(chunk_ids)
+    while page := list(islice(iterator, size)):
+        yield page
+
+
 def compute_report(
-    chunk_ids: list[int],
+    chunk_ids: Iterable[int],
     *,
     sample_size: int,
-):
-    vector_store = build_vector_store()
-    existing = vector_store.existing_ids(chunk_ids)
-    missing = sorted(set(chunk_ids) - existing)
-    preview = missing[: max(0, sample_size)] if sample_size > 0 else []
+    vector_store,  # type: ignore[no-untyped-def]
+    runner: asyncio.Runner,
+) -> ConsistencyReport:
+    """Diff ids against Qdrant one page at a time, keeping only a preview."""
+    chunk_count = 0
+    missing_count = 0
+    preview: list[int] = []
+    # The ORM cursor is only read between runner.run calls, so Django never
+    # sees a running loop.
+    for page in _id_pages(chunk_ids, ID_STREAM_CHUNK_SIZE):
+        chunk_count += len(page)
+        existing = runner.run(vector_store.existing_ids_async(page))
+        for chunk_id in page:
+            if chunk_id in existing:
+                continue
+            missing_count += 1
+            if len(preview) < sample_size:
+                preview.append(chunk_id)
     return ConsistencyReport(
-        chunk_count=len(chunk_ids),
-        missing_count=len(missing),
+        chunk_count=chunk_count,
+        missing_count=missing_count,
         missing_ids_preview=preview,
     )
 
 
+def check_scopes(
+    jurisdictions: Sequence[str | None],
+    *,
+    language: str | None,
+    limit: int,
+    sample_size: int,
+    vector_store,  # type: ignore[no-untyped-def]
+) -> dict[str, ConsistencyReport]:
+    """Report each jurisdiction in turn on one event loop and async client."""
+    reports: dict[str, ConsistencyReport] = {}
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        try:
+            for jurisdiction in jurisdictions:
+                label = jurisdiction or "*"
+                logging.info(
+                    "Checking chunks (jurisdiction=%s, language=%s)",
+                    label,
+                    language or "*",
+                )
+                chunk_ids = gather_chunk_ids(
+                    jurisdiction=jurisdiction,
+                    language=language,
+                    limit=limit,
+                )
+                report = compute_report(
+                    chunk_ids,
+                    sample_size=sample_size,
+                    vector_store=vector_store,
+                    runner=runner,
+                )
+                reports[label] = report
+                log_report(label, report)
+        finally:
+            # The async client is bound to this loop; close it before the
+            # runner shuts the loop down.
+            runner.run(vector_store.aclose())
+    return reports
+
+
+# MARK: Reporting
+
+
+class _LazyJoin:
+    """Join values only when the log record is actually formatted."""
+
+    __slots__ = ("values", "sep")
+
+    def __init__(self, values: Iterable[object], sep: str = ", ") -> None:
+        self.values = values
+        self.sep = sep
+
+    def __str__(self) -> str:
+        return self.sep.join(map(str, self.values)) or "<none>"
+
+
+def log_report(label: str, report: ConsistencyReport) -> None:
+    if not report.chunk_count:
+        logging.warning(
+            "No KnowledgeChunk records matched the provided filters (jurisdiction=%s).",
+            label,
+        )
+    elif report.all_synced:
+        logging.info(
+            "All %s chunk(s) have matching vectors in Qdrant (jurisdiction=%s).",
+            report.chunk_count,
+            label,
+        )
+    else:
+        logging.error(
+            "Detected %s chunk(s) without vectors in Qdrant (jurisdiction=%s, showing up to %s ids): %s",
+            report.missing_count,
+            label,
+            len(report.missing_ids_preview),
+            _LazyJoin(report.missing_ids_preview),
+        )
+
+
+def log_summary(reports: dict[str, ConsistencyReport]) -> None:
+    width = max(len("jurisdiction"), *(len(label) for label in reports))
+    lines = [f"{'jurisdiction':<{width}}  {'chunks':>10}  {'missing':>10}"]
+    lines.extend(
+        f"{label:<{width}}  {report.chunk_count:>10}  {report.missing_count:>10}"
+        for label, report in reports.items()
+    )
+    logging.info("Consistency summary:\n%s", "\n".join(lines))
+
+
 # MARK: Runner
 
 
@@ -147,45 +266,29 @@ def main(argv: Iterable[str] | None = None) -> int:
         logging.error("Failed to configure Django: %s", exc)
         return 2
 
-    chunk_ids = gather_chunk_ids(
-        jurisdiction=args.jurisdiction,
-        language=args.language,
-        limit=args.limit,
-    )
-
-    if not chunk_ids:
-        logging.warning(
-            "No KnowledgeChunk records matched the provided filters.")
-        return 0
-
-    logging.info(
-        "Checking %s chunk(s) (jurisdiction=%s, language=%s)",
-        len(chunk_ids),
-        args.jurisdiction or "*",
-        args.language or "*",
-    )
-
     try:
-        report = compute_report(chunk_ids, sample_size=args.sample_size)
+        vector_store = build_vector_store()
     except RuntimeError as exc:
         logging.error("Unable to construct Qdrant client: %s", exc)
         return 2
+
+    try:
+        reports = check_scopes(
+            args.jurisdiction or [None],
+            language=args.language,
+            limit=args.limit,
+            sample_size=args.sample_size,
+            vector_store=vector_store,
+        )
     except Exception as exc:  # pragma: no cover - network guard
         logging.error("Failed to query Qdrant: %s", exc)
         return 2
 
-    if report.all_synced:
-        logging.info(
-            "All %s chunk(s) have matching vectors in Qdrant.", report.chunk_count)
-        return 0
+    if len(reports) > 1:
+        log_summary(reports)
 
-    logging.error(
-        "Detected %s chunk(s) without vectors in Qdrant (showing up to %s ids): %s",
-        report.missing_count,
-        len(report.missing_ids_preview),
-        ", ".join(str(identifier)
-                  for identifier in report.missing_ids_preview) or "<none>",
-    )
+    if all(report.all_synced for report in reports.values()):
+        return 0
     logging.error(
         "Re-run the ingestion pipeline or the verify_embeddings management command to repair the gaps.",
     )
@@ -30,16 +30,13 @@ def load_env_file(path: Path) -> None:
     if not path.exists():
         return
 
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if stripped.startswith("\ufeff"):
-                stripped = stripped.lstrip("\ufeff")
-            if not stripped or stripped.startswith("#"):
-                continue
-            if "=" not in stripped:
-                continue
-            key, value = stripped.split("=", 1)
+    # One read and one decode; utf-8-sig drops a leading BOM once.
+    for line in path.read_bytes().decode("utf-8-sig").splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, separator, value = stripped.partition("=")
+        if separator:
             os.environ.setdefault(key, value)
 
 
@@ -58,8 +55,7 @@ def run_smoke_test(client: QdrantClient, *, base_collection: str) -> None:
     temp_collection = f"{base_collection}_smoke_{uuid.uuid4().hex[:8]}".strip(
         "_")
     try:
-        if client.collection_exists(temp_collection):  # pragma: no cover - safety
-            client.delete_collection(collection_name=temp_collection)
+        # The uuid suffix makes the name fresh, so no existence probe is needed.
         client.create_collection(
             collection_name=temp_collection,
             vectors_config=qmodels.VectorParams(
@@ -70,7 +66,8 @@ def run_smoke_test(client: QdrantClient, *, base_collection: str) -> None:
             vector=[0.1, 0.2, 0.3],
             payload={"label": "smoke"},
         )
-        client.upsert(collection_name=temp_collection, points=[point])
+        client.upsert(collection_name=temp_collection,
+                      points=[point], wait=True)
         response = client.query_points(
             collection_name=temp_collection,
             query=[0.1, 0.2, 0.3],
@@ -96,14 +93,7 @@ def main(argv: Iterable[str] | None = None) -> int:
         load_env_file(env_path)
 
     config = QdrantConfig.from_env()
-    client = QdrantClient(
-        host=config.host,
-        port=config.port,
-        https=config.use_tls,
-        api_key=config.api_key,
-        timeout=config.timeout_seconds,
-        prefer_grpc=False,
-    )
+    client = QdrantClient(**config.client_options())
     run_smoke_test(client, base_collection=config.collection)
 
     print("Qdrant smoke test succeeded; round-trip search worked as expected")
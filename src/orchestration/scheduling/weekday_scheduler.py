@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-import datetime
 import logging
+import time
 from typing import Iterable
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -36,8 +36,8 @@ class WeekdayHourlyScheduler:
 
     def run_fallback(self) -> None:
         """Run fallback execution for missed jobs."""
-        now = datetime.datetime.utcnow()
-        if now.weekday() >= 5:
+        # tm_wday uses Monday=0 like datetime.weekday(), without a datetime.
+        if time.gmtime().tm_wday >= 5:
             logger.debug("Fallback skip on weekend")
             return
         self._dispatch_jobs()
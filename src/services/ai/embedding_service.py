@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import os
+import sys
+from array import array
+from base64 import b64decode
 from dataclasses import dataclass
 from typing import Iterable, Sequence
 
 from openai import OpenAI
 
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
 
 @dataclass(frozen=True)
 class EmbeddingConfig:
@@ -15,6 +20,7 @@ class EmbeddingConfig:
 
     api_key: str
     model: str
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS
 
     @staticmethod
     def from_env() -> "EmbeddingConfig":
@@ -22,7 +28,20 @@ class EmbeddingConfig:
         if not api_key:
             raise RuntimeError("OPENAI_API_KEY is required for embeddings")
         model = os.getenv("EMBEDDING_MODEL", "text-embedding-3-large")
-        return EmbeddingConfig(api_key=api_key, model=model)
+        concurrency_raw = os.getenv(
+            "EMBEDDING_MAX_CONCURRENT_REQUESTS",
+            str(DEFAULT_MAX_CONCURRENT_REQUESTS),
+        )
+        try:
+            max_concurrent_requests = max(1, int(concurrency_raw))
+        except ValueError as exc:  # pragma: no cover - configuration guard
+            raise RuntimeError(
+                "EMBEDDING_MAX_CONCURRENT_REQUESTS must be numeric") from exc
+        return EmbeddingConfig(
+            api_key=api_key,
+            model=model,
+            max_concurrent_requests=max_concurrent_requests,
+        )
 
 
 class EmbeddingService:
@@ -31,11 +50,32 @@ class EmbeddingService:
     def __init__(self, config: EmbeddingConfig) -> None:
         self._client = OpenAI(api_key=config.api_key)
         self._model = config.model
+        self._max_concurrent_requests = config.max_concurrent_requests
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        return self._max_concurrent_requests
 
     def embed(self, texts: Iterable[str]) -> Sequence[Sequence[float]]:
-        """Generate embeddings for the supplied texts."""
+        """Generate embeddings for the supplied texts as float32 arrays."""
         response = self._client.embeddings.create(
             model=self._model,
             input=list(texts),
+            encoding_format="base64",
         )
-        return [item.embedding for item in response.data]
+        return [_decode_embedding(item.embedding) for item in response.data]
+
+
+def _decode_embedding(data: str | Sequence[float]) -> array:
+    """Decode a base64 little-endian float32 payload without per-float objects."""
+    if not isinstance(data, str):
+        return array("f", data)
+    vector = array("f")
+    vector.frombytes(b64decode(data))
+    if sys.byteorder == "big":
+        vector.byteswap()
+    return vector
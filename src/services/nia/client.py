@@ -30,14 +30,17 @@ class NiaClient:
 
     def __init__(self, config: NiaConfig) -> None:
         self._config = config
+        # Headers never change for a config, so they live on a keep-alive
+        # session instead of being rebuilt for every request.
+        self._session = requests.Session()
+        self._session.headers.update({
+            "Authorization": f"Bearer {config.api_key}",
+            "Content-Type": "application/json",
+        })
 
     def enrich(self, query: str) -> Iterable[Mapping[str, str]]:
-        response = requests.post(
+        response = self._session.post(
             self._config.endpoint,
-            headers={
-                "Authorization": f"Bearer {self._config.api_key}",
-                "Content-Type": "application/json",
-            },
             json={"query": query},
             timeout=30,
         )
@@ -3,7 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List
+from functools import lru_cache
+from typing import Callable, Iterable, List
+
+try:  # pragma: no cover - optional dependency guard
+    import tiktoken
+except ModuleNotFoundError:  # pragma: no cover - exercised when not installed
+    tiktoken = None  # type: ignore[assignment]
+
+CHARS_PER_TOKEN = 4
+# Tokenizer shared by the OpenAI text-embedding-3 and ada-002 models.
+EMBEDDING_ENCODING = "cl100k_base"
+MAX_UTF8_BYTES_PER_CHAR = 4
 
 
 @dataclass(frozen=True)
@@ -16,7 +27,7 @@ class Chunk:
 
 def chunk_text(title: str, text: str, max_length: int = 800) -> Iterable[Chunk]:
     """Yield paragraph-based chunks up to max_length characters."""
-    paragraphs: List[str] = [p.strip() for p in text.split("\n") if p.strip()]
+    paragraphs: List[str] = [p for p in map(str.strip, text.split("\n")) if p]
     if not paragraphs:
         yield Chunk(title=title, text=text.strip())
         return
@@ -46,3 +57,58 @@ def _split_paragraph(paragraph: str, max_length: int) -> List[str]:
         paragraph[idx: idx + max_length]
         for idx in range(0, len(paragraph), max_length)
     ]
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count using a conservative characters-per-token ratio."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def truncate_to_token_limit(
+    text: str,
+    max_tokens: int,
+    token_counter: Callable[[str], int] = estimate_tokens,
+) -> str:
+    """Return the longest prefix within max_tokens, cut at a word boundary."""
+    if token_counter(text) <= max_tokens:
+        return text
+    if token_counter is estimate_tokens:
+        # The estimate is ceil(len / CHARS_PER_TOKEN); invert it directly.
+        low = max(0, max_tokens) * CHARS_PER_TOKEN
+    else:
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if token_counter(text[:mid]) <= max_tokens:
+                low = mid
+            else:
+                high = mid - 1
+    prefix = text[:low]
+    boundary = max(prefix.rfind(" "), prefix.rfind("\n"))
+    if boundary > 0:
+        prefix = prefix[:boundary]
+    return prefix.rstrip()
+
+
+@lru_cache(maxsize=1)
+def _embedding_encoding():  # type: ignore[no-untyped-def]
+    return tiktoken.get_encoding(EMBEDDING_ENCODING)
+
+
+def token_safe_length(max_tokens: int) -> int:
+    """Longest text, in characters, that cannot exceed max_tokens."""
+    if tiktoken is None:
+        return max_tokens * CHARS_PER_TOKEN
+    # Byte-level BPE never emits more tokens than the text has UTF-8 bytes.
+    return max_tokens // MAX_UTF8_BYTES_PER_CHAR
+
+
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """Truncate to max_tokens with tiktoken, or the character heuristic without it."""
+    if tiktoken is None:
+        return truncate_to_token_limit(text, max_tokens)
+    encoding = _embedding_encoding()
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]).rstrip()
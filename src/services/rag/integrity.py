@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import Iterator, Sequence
 
 from django.db import transaction
+from django.utils import timezone
 
 from parliament.rag.models import KnowledgeChunk
 from src.services.ai.embedding_service import EmbeddingService
@@ -15,6 +16,7 @@ from src.services.rag.vector_store import QdrantVectorStore
 logger = logging.getLogger(__name__)
 
 DEFAULT_BATCH_SIZE = 32
+SCAN_PAGE_SIZE = 1000
 
 
 # MARK: Results
@@ -53,19 +55,16 @@ class EmbeddingIntegrityService:
 
     def verify_scope(self, *, jurisdiction: str, language: str) -> EmbeddingVerificationResult:
         """Ensure all chunks in the requested scope have embeddings and vectors."""
-        chunks = list(
-            KnowledgeChunk.objects.filter(
-                jurisdiction=jurisdiction,
-                language=language,
-            ).order_by("id")
-        )
-        if not chunks:
+        total = reembedded = reindexed = 0
+        for page in self._scan_pages(jurisdiction=jurisdiction, language=language):
+            total += len(page)
+            reembedded += self._ensure_embeddings(page)
+            reindexed += self._ensure_vector_records(page)
+        if not total:
             return EmbeddingVerificationResult(0, 0, 0)
 
-        reembedded = self._ensure_embeddings(chunks)
-        reindexed = self._ensure_vector_records(chunks)
         result = EmbeddingVerificationResult(
-            total_chunks=len(chunks),
+            total_chunks=total,
             reembedded=reembedded,
             reindexed=reindexed,
         )
@@ -81,6 +80,22 @@ class EmbeddingIntegrityService:
 
     # MARK: Internal helpers
 
+    def _scan_pages(
+        self, *, jurisdiction: str, language: str
+    ) -> Iterator[list[KnowledgeChunk]]:
+        """Yield chunks in id order, one keyset page at a time."""
+        queryset = KnowledgeChunk.objects.filter(
+            jurisdiction=jurisdiction,
+            language=language,
+        ).order_by("id")
+        last_id = 0
+        while True:
+            page = list(queryset.filter(id__gt=last_id)[:SCAN_PAGE_SIZE])
+            if not page:
+                return
+            yield page
+            last_id = page[-1].id
+
     def _ensure_embeddings(self, chunks: Sequence[KnowledgeChunk]) -> int:
         missing = [chunk for chunk in chunks if not chunk.embedding]
         if not missing:
@@ -89,10 +104,13 @@ class EmbeddingIntegrityService:
         updated = 0
         for batch in self._batched(missing, self._batch_size):
             texts = [chunk.content for chunk in batch]
-            embeddings = self._embedding_service.embed(texts)
+            embeddings = list(self._embedding_service.embed(texts))
+            # One UPDATE and commit per batch; vectors are indexed only once
+            # rows persist.
+            with transaction.atomic():
+                self._update_chunk_embeddings(batch, embeddings)
             for chunk, embedding in zip(batch, embeddings):
                 payload = self._prepare_payload(chunk)
-                self._update_chunk_embedding(chunk, embedding)
                 self._upsert_vector(chunk.id, embedding, payload)
                 updated += 1
         return updated
@@ -100,8 +118,8 @@ class EmbeddingIntegrityService:
     def _ensure_vector_records(self, chunks: Sequence[KnowledgeChunk]) -> int:
         ids = [chunk.id for chunk in chunks]
         existing = self._vector_store.existing_ids(ids)
-        missing_ids = [
-            chunk_id for chunk_id in ids if chunk_id not in existing]
+        missing_ids = {
+            chunk_id for chunk_id in ids if chunk_id not in existing}
         if not missing_ids:
             return 0
 
@@ -127,10 +145,19 @@ class EmbeddingIntegrityService:
             "title": chunk.title,
         }
 
-    def _update_chunk_embedding(self, chunk: KnowledgeChunk, embedding: Sequence[float]) -> None:
-        chunk.embedding = list(embedding)
-        with transaction.atomic():
-            chunk.save(update_fields=["embedding", "updated_at"])
+    def _update_chunk_embeddings(
+        self,
+        chunks: Sequence[KnowledgeChunk],
+        embeddings: Sequence[Sequence[float]],
+    ) -> None:
+        # bulk_update skips auto_now, so stamp updated_at explicitly.
+        now = timezone.now()
+        updated: list[KnowledgeChunk] = []
+        for chunk, embedding in zip(chunks, embeddings):
+            chunk.embedding = embedding
+            chunk.updated_at = now
+            updated.append(chunk)
+        KnowledgeChunk.objects.bulk_update(updated, ["embedding", "updated_at"])
 
     def _upsert_vector(
         self,
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
 from typing import Iterable, Iterator, Mapping, Sequence
 from urllib.parse import urlparse
 
 try:  # pragma: no cover - optional dependency guard
-    from qdrant_client import QdrantClient
+    from qdrant_client import AsyncQdrantClient, QdrantClient
     from qdrant_client.http import models as qmodels
 except ModuleNotFoundError as exc:  # pragma: no cover - exercised in tests
+    AsyncQdrantClient = None  # type: ignore[assignment]
     QdrantClient = None  # type: ignore[assignment]
     qmodels = None  # type: ignore[assignment]
     _QDRANT_IMPORT_ERROR = exc
@@ -20,6 +22,12 @@ else:
 
 DEFAULT_HTTP_PORT = 6333
 DEFAULT_HTTPS_PORT = 443
+DEFAULT_GRPC_PORT = 6334
+UPSERT_BATCH_SIZE = 256
+RETRIEVE_BATCH_SIZE = 1000
+MAX_CONCURRENT_RETRIEVES = 8
+QUANTIZATION_QUANTILE = 0.99
+SEARCH_OVERSAMPLING = 2.0
 
 
 @dataclass(frozen=True)
@@ -32,6 +40,9 @@ class QdrantConfig:
     api_key: str | None
     collection: str
     timeout_seconds: float
+    scalar_quantization: bool = True
+    prefer_grpc: bool = False
+    grpc_port: int = DEFAULT_GRPC_PORT
 
     @property
     def scheme(self) -> str:
@@ -77,6 +88,18 @@ class QdrantConfig:
             raise RuntimeError(
                 "QDRANT_TIMEOUT_SECONDS must be numeric") from exc
 
+        quantization_raw = os.getenv("QDRANT_SCALAR_QUANTIZATION", "true")
+        scalar_quantization = quantization_raw.strip().lower() in {
+            "1", "true", "yes", "on"}
+
+        grpc_raw = os.getenv("QDRANT_PREFER_GRPC", "false")
+        prefer_grpc = grpc_raw.strip().lower() in {"1", "true", "yes", "on"}
+        grpc_port_raw = os.getenv("QDRANT_GRPC_PORT", str(DEFAULT_GRPC_PORT))
+        try:
+            grpc_port = int(grpc_port_raw)
+        except ValueError as exc:  # pragma: no cover - configuration guard
+            raise RuntimeError("QDRANT_GRPC_PORT must be numeric") from exc
+
         return QdrantConfig(
             host=host,
             port=port,
@@ -84,8 +107,23 @@ class QdrantConfig:
             api_key=api_key,
             collection=collection,
             timeout_seconds=timeout,
+            scalar_quantization=scalar_quantization,
+            prefer_grpc=prefer_grpc,
+            grpc_port=grpc_port,
         )
 
+    def client_options(self) -> dict[str, object]:
+        """Keyword arguments shared by the sync and async Qdrant clients."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "grpc_port": self.grpc_port,
+            "prefer_grpc": self.prefer_grpc,
+            "https": self.use_tls,
+            "api_key": self.api_key,
+            "timeout": self.timeout_seconds,
+        }
+
 
 class QdrantVectorStore:
     """Thin wrapper around the Qdrant client for chunk storage."""
@@ -96,14 +134,12 @@ class QdrantVectorStore:
                 "qdrant_client package is required to use QdrantVectorStore"
             ) from _QDRANT_IMPORT_ERROR
         self._collection = config.collection
-        self._client = QdrantClient(
-            host=config.host,
-            port=config.port,
-            https=config.use_tls,
-            api_key=config.api_key,
-            timeout=config.timeout_seconds,
-            prefer_grpc=False,
-        )
+        self._scalar_quantization = config.scalar_quantization
+        self._client_options = config.client_options()
+        self._client = QdrantClient(**self._client_options)
+        # Created on first async use and bound to that event loop until aclose().
+        self._async_client: AsyncQdrantClient | None = None
+        self._async_collection_exists: bool | None = None
 
     # MARK: Collection management
 
@@ -111,13 +147,28 @@ class QdrantVectorStore:
         """Create the collection if it does not already exist."""
         if self._client.collection_exists(self._collection):
             return
+        # INT8 scalar quantization keeps a 4x smaller copy of each vector in
+        # RAM for scoring; the original float32 vectors stay on disk.
         vectors_config = qmodels.VectorParams(
             size=vector_size,
             distance=qmodels.Distance.COSINE,
+            on_disk=self._scalar_quantization,
+        )
+        quantization_config = (
+            qmodels.ScalarQuantization(
+                scalar=qmodels.ScalarQuantizationConfig(
+                    type=qmodels.ScalarType.INT8,
+                    quantile=QUANTIZATION_QUANTILE,
+                    always_ram=True,
+                )
+            )
+            if self._scalar_quantization
+            else None
         )
         self._client.create_collection(
             collection_name=self._collection,
             vectors_config=vectors_config,
+            quantization_config=quantization_config,
         )
 
     # MARK: Mutation helpers
@@ -128,6 +179,7 @@ class QdrantVectorStore:
         point_id: int,
         vector: Sequence[float],
         payload: Mapping[str, object],
+        wait: bool = True,
     ) -> None:
         self.ensure_collection(len(vector))
         point = qmodels.PointStruct(
@@ -138,8 +190,40 @@ class QdrantVectorStore:
         self._client.upsert(
             collection_name=self._collection,
             points=[point],
+            wait=wait,
         )
 
+    def upsert_many(
+        self,
+        points: Sequence[tuple[int, Sequence[float], Mapping[str, object]]],
+        *,
+        batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> None:
+        """Upsert ``(id, vector, payload)`` triples in batched requests.
+
+        Batches are sent without waiting for the WAL, except the last one.
+        Qdrant applies updates to a collection in order, so waiting on the
+        final batch is a barrier for the whole call.
+        """
+        if not points:
+            return
+        self.ensure_collection(len(points[0][1]))
+        step = max(1, batch_size)
+        for start in range(0, len(points), step):
+            batch = points[start: start + step]
+            self._client.upsert(
+                collection_name=self._collection,
+                points=[
+                    qmodels.PointStruct(
+                        id=point_id,
+                        vector=list(vector),
+                        payload=dict(payload),
+                    )
+                    for point_id, vector, payload in batch
+                ],
+                wait=start + step >= len(points),
+            )
+
     def delete(self, point_ids: Iterable[int]) -> None:
         ids = list(point_ids)
         if not ids:
@@ -173,10 +257,23 @@ class QdrantVectorStore:
                 ),
             ]
         )
+        # Oversample on the quantized index, then rescore the candidates
+        # against the float32 originals to recover full-precision ranking.
+        search_params = (
+            qmodels.SearchParams(
+                quantization=qmodels.QuantizationSearchParams(
+                    rescore=True,
+                    oversampling=SEARCH_OVERSAMPLING,
+                )
+            )
+            if self._scalar_quantization
+            else None
+        )
         response = self._client.query_points(
             collection_name=self._collection,
             query=list(vector),
             query_filter=filters,
+            search_params=search_params,
             limit=limit,
             with_payload=True,
         )
@@ -189,18 +286,74 @@ class QdrantVectorStore:
         if not self._client.collection_exists(self._collection):
             return set()
         found: set[int] = set()
-        for batch in self._batched(ids, 256):
+        for batch in self._batched(ids, RETRIEVE_BATCH_SIZE):
             records = self._client.retrieve(
                 collection_name=self._collection,
                 ids=list(batch),
                 with_vectors=False,
                 with_payload=False,
             )
-            for record in records:
-                try:
-                    found.add(int(record.id))
-                except (TypeError, ValueError):  # pragma: no cover - defensive cast
-                    continue
+            found.update(self._record_ids(records))
+        return found
+
+    async def existing_ids_async(
+        self,
+        ids: Sequence[int],
+        *,
+        batch_size: int = RETRIEVE_BATCH_SIZE,
+        max_concurrency: int = MAX_CONCURRENT_RETRIEVES,
+    ) -> set[int]:
+        """Like ``existing_ids`` but with up to ``max_concurrency`` retrieves in flight.
+
+        The async client, its connection pool and the collection probe are
+        reused across calls until ``aclose`` is awaited on the same loop.
+        """
+        if not ids:
+            return set()
+        client = self._async_client_for(max_concurrency)
+        if self._async_collection_exists is None:
+            self._async_collection_exists = await client.collection_exists(
+                self._collection)
+        if not self._async_collection_exists:
+            return set()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def retrieve(batch: Sequence[int]) -> set[int]:
+            async with semaphore:
+                records = await client.retrieve(
+                    collection_name=self._collection,
+                    ids=list(batch),
+                    with_vectors=False,
+                    with_payload=False,
+                )
+            return self._record_ids(records)
+
+        results = await asyncio.gather(
+            *(retrieve(batch) for batch in self._batched(ids, batch_size))
+        )
+        return set().union(*results)
+
+    async def aclose(self) -> None:
+        """Close the async client; the next async call opens a fresh one."""
+        client, self._async_client = self._async_client, None
+        self._async_collection_exists = None
+        if client is not None:
+            await client.close()
+
+    def _async_client_for(self, max_concurrency: int) -> AsyncQdrantClient:
+        if self._async_client is None:
+            self._async_client = AsyncQdrantClient(
+                **self._client_options, pool_size=max(1, max_concurrency))
+        return self._async_client
+
+    @staticmethod
+    def _record_ids(records: Iterable[qmodels.Record]) -> set[int]:
+        found: set[int] = set()
+        for record in records:
+            try:
+                found.add(int(record.id))
+            except (TypeError, ValueError):  # pragma: no cover - defensive cast
+                continue
         return found
 
     def _batched(self, items: Sequence[int], size: int) -> Iterator[Sequence[int]]:
@@ -142,3 +142,75 @@ class HourlyRunCoordinatorTests(TestCase):
                          EtlJobCheckpoint.Status.SUCCESS)
         self.assertEqual(results["job_repeat"].attempt, 1)
         self.assertEqual(checkpoint.status, EtlJobCheckpoint.Status.SUCCESS)
+
+    def test_dependency_runs_after_upstream_success(self) -> None:
+        order: list[str] = []
+
+        def upstream() -> None:
+            order.append("upstream")
+
+        def downstream() -> None:
+            order.append("downstream")
+
+        coordinator = HourlyRunCoordinator(
+            (
+                EtlJobDefinition(
+                    "job_downstream",
+                    downstream,
+                    max_attempts=1,
+                    dependencies=("job_upstream",),
+                ),
+                EtlJobDefinition("job_upstream", upstream, max_attempts=1),
+            ),
+            sleep=lambda _: None,
+        )
+        results = coordinator.run(self.window)
+        self.assertEqual(order, ["upstream", "downstream"])
+        self.assertEqual(results["job_downstream"].status,
+                         EtlJobCheckpoint.Status.SUCCESS)
+
+    def test_unchanged_checkpoint_is_not_saved(self) -> None:
+        checkpoint = EtlJobCheckpoint.objects.create(
+            job_name="job_noop",
+            status=EtlJobCheckpoint.Status.SUCCESS,
+        )
+        touched = checkpoint.updated_at
+
+        saved = HourlyRunCoordinator._save_changes(
+            checkpoint,
+            status=EtlJobCheckpoint.Status.SUCCESS,
+            last_error="",
+        )
+
+        checkpoint.refresh_from_db()
+        self.assertFalse(saved)
+        self.assertEqual(checkpoint.updated_at, touched)
+
+    def test_fresh_timestamps_alone_do_not_save_checkpoint(self) -> None:
+        checkpoint = EtlJobCheckpoint.objects.create(
+            job_name="job_stamped",
+            status=EtlJobCheckpoint.Status.SUCCESS,
+        )
+        touched = checkpoint.updated_at
+
+        saved = HourlyRunCoordinator._save_changes(
+            checkpoint,
+            {"last_completed_at": timezone.now()},
+            status=EtlJobCheckpoint.Status.SUCCESS,
+        )
+
+        checkpoint.refresh_from_db()
+        self.assertFalse(saved)
+        self.assertEqual(checkpoint.updated_at, touched)
+        self.assertIsNone(checkpoint.last_completed_at)
+
+        stamp = timezone.now()
+        saved = HourlyRunCoordinator._save_changes(
+            checkpoint,
+            {"last_completed_at": stamp},
+            status=EtlJobCheckpoint.Status.FAILED,
+        )
+
+        checkpoint.refresh_from_db()
+        self.assertTrue(saved)
+        self.assertEqual(checkpoint.last_completed_at, stamp)